@@ -19,11 +19,18 @@ continuous_deployment.yml for Azure DevOps Pipeline CD definition
 """
 
 import os
+import io
+import contextlib
+import importlib
+import importlib.metadata
+import hashlib
 import shutil
 import subprocess
 import argparse
-import glob
 import sys
+import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
 package_name = "mssql_dataframe"
 venv_dir = "env"
@@ -37,29 +44,97 @@ coverage_file = "reports/.coverage"
 coverage_xml = "reports/coverage.xml"
 coverage_fail_under = 100
 genbadge_dir = "reports"
+config_files = ["setup.cfg", "pyproject.toml"]
+linter_cache_dir = ".cicd_cache/linter"
 
+# resolve virtual environment executables once per process
+venv_bin = os.path.join(os.getcwd(), venv_dir, "Scripts")
+venv_cmds = {}
 
-def run_cmd(cmd, venv=True):
-    """Generic command line process and error if needed. Otherwise stdout is returned."""
+# avoid allocating a console window for each child process on Windows
+creationflags = subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
+
+
+def run_cmd(cmd, venv=True, input=None, capture=False):
+    """Generic command line process and error if needed. Otherwise stdout is returned if captured.
+
+    Unless capture=True, stdout is passed through directly to the terminal and only stderr is
+    buffered for error reporting.
+    """
     # run all commands in virtual environment by default
     if venv:
-        cmd[0] = os.path.join(os.getcwd(), "env", "Scripts", cmd[0])
-    # call command line process
-    status = subprocess.run(cmd, capture_output=True)
-    if status.returncode != 0:
-        if len(status.stderr) > 0:
-            msg = status.stderr.decode("utf-8")
-        else:
-            msg = status.stdout.decode("utf-8")
-        msg = (
-            "stderr:\n"
-            + status.stderr.decode("utf-8")
-            + "\n\nstdout:\n"
-            + status.stdout.decode("utf-8")
-        )
+        if cmd[0] not in venv_cmds:
+            venv_cmds[cmd[0]] = os.path.join(venv_bin, cmd[0])
+        cmd[0] = venv_cmds[cmd[0]]
+    # call command line process, waiting in communicate releases the GIL for concurrent calls
+    process = subprocess.Popen(
+        cmd,
+        stdin=None if input is None else subprocess.PIPE,
+        stdout=subprocess.PIPE if capture else None,
+        stderr=subprocess.PIPE,
+        text=True,
+        creationflags=creationflags,
+    )
+    stdout, stderr = process.communicate(input)
+    if process.returncode != 0:
+        msg = "stderr:\n" + stderr
+        if capture:
+            msg += "\n\nstdout:\n" + stdout
         raise RuntimeError(msg)
 
-    return status.stdout.decode("utf-8")
+    return stdout
+
+
+def run_inproc(module_name, argv):
+    """Call the main function of a module in this interpreter and error if needed. Otherwise stdout is returned.
+
+    This script runs in the virtual environment so tools can be imported directly, avoiding process creation.
+    """
+    module = importlib.import_module(module_name)
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+    argv_original = sys.argv
+    sys.argv = [module_name] + argv
+    try:
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            try:
+                status = module.main()
+            except SystemExit as err:
+                status = err.code
+    finally:
+        sys.argv = argv_original
+    # a return or exit status of None, 0, or False indicates success
+    if status:
+        msg = "stderr:\n" + stderr.getvalue() + "\n\nstdout:\n" + stdout.getvalue()
+        raise RuntimeError(msg)
+
+    return stdout.getvalue()
+
+
+def run_worker(module, command, jobs):
+    """Run multiple invocations of a click command in a single persistent interpreter.
+
+    Each job is a list of command line arguments passed to the worker as a line of JSON,
+    so interpreter startup and imports are only paid once.
+    """
+    script = (
+        "import json, sys\n"
+        f"from {module} import {command}\n"
+        "for line in sys.stdin:\n"
+        f"    {command}(args=json.loads(line), standalone_mode=False)\n"
+    )
+    jobs = "".join([json.dumps(job) + "\n" for job in jobs])
+
+    return run_cmd(["python", "-c", script], input=jobs)
+
+
+def run_concurrent(checks):
+    """Run independent read-only checks concurrently and raise the first failure."""
+    max_workers = max(1, (os.cpu_count() or 1) - 2)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(check) for check in checks]
+    for future in futures:
+        future.result()
 
 
 def remove_output_dirs():
@@ -68,11 +143,83 @@ def remove_output_dirs():
             shutil.rmtree(dir)
 
 
-def check_black_formatting():
-    cmd = ["black", ".", "--check", f"--extend-exclude={markdown_test_dir}"]
+def changed_python_files():
+    """Python files added, modified, or renamed compared to the main branch.
+
+    None is returned to check all files if the changes cannot be determined, no Python files
+    changed, or a linter configuration file changed.
+    """
+    cmd = ["git", "diff", "--name-only", "--diff-filter=AMR", "origin/main...HEAD"]
+    try:
+        changed = run_cmd(cmd, venv=False, capture=True).splitlines()
+    except (RuntimeError, OSError):
+        return None
+    if any(file in config_files for file in changed):
+        return None
+    changed = [file for file in changed if file.endswith(".py")]
+    if not changed:
+        return None
+
+    return changed
+
+
+def lint_inputs(files, root):
+    """Files read by a linter, either the changed files or all Python files under root."""
+    if files is not None:
+        return files
+    exclude = [venv_dir, build_dir, build_test_dir, markdown_test_dir, ".git"]
+    exclude = {os.path.normpath(dir) for dir in exclude}
+    inputs = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [
+            dir
+            for dir in dirnames
+            if os.path.normpath(os.path.join(dirpath, dir)) not in exclude
+        ]
+        inputs += [os.path.join(dirpath, f) for f in filenames if f.endswith(".py")]
+
+    return inputs
+
+
+def run_cached(tool, cmd, inputs, output_file=None):
+    """Run a linter unless it previously ran with identical inputs, configuration, and version.
+
+    Only successes are stored in linter_cache_dir as <hash>.ok, including the contents of
+    output_file. Failures are always rerun so their findings and output_file are current, and
+    environment problems such as a missing plugin or an interrupted run aren't remembered.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(" ".join(cmd).encode())
+    digest.update(importlib.metadata.version(tool).encode())
+    for path in sorted(inputs) + config_files:
+        if os.path.exists(path):
+            digest.update(path.encode())
+            with open(path, "rb") as fh:
+                digest.update(fh.read())
+    cached = os.path.join(linter_cache_dir, tool, digest.hexdigest())
+
+    if os.path.exists(cached + ".ok"):
+        print(f"Using cached result for '{' '.join(cmd)}'.")
+        if output_file is not None:
+            os.makedirs(os.path.dirname(output_file), exist_ok=True)
+            shutil.copyfile(cached + ".ok", output_file)
+        return
+
+    # errors are raised before anything is cached
+    _ = run_cmd(cmd)
+    os.makedirs(os.path.dirname(cached), exist_ok=True)
+    if output_file is None:
+        open(cached + ".ok", "w").close()
+    else:
+        shutil.copyfile(output_file, cached + ".ok")
+
+
+def check_black_formatting(files=None):
+    cmd = ["black", "--check", f"--extend-exclude={markdown_test_dir}"]
+    cmd += ["."] if files is None else files
     print(f"Checking code format '{' '.join(cmd)}'.")
     try:
-        _ = run_cmd(cmd)
+        run_cached("black", cmd, lint_inputs(files, "."))
     except RuntimeError as err:
         raise RuntimeError(
             f"black format check failed. Run 'black . --extend-exclude={markdown_test_dir}' to automatically apply format changes.",
@@ -81,6 +228,7 @@ def check_black_formatting():
 
 
 def check_flake8_style():
+    # always check all files since the output file is used for the flake8 badge
     exclude = f"{venv_dir}, {markdown_test_dir}, {build_test_dir}"
     cmd = [
         "flake8",
@@ -89,20 +237,36 @@ def check_flake8_style():
         f"--extend-exclude={exclude}",
     ]
     print(f"Checking code style '{' '.join(cmd)}'.")
-    _ = run_cmd(cmd)
+    run_cached("flake8", cmd, lint_inputs(None, "."), output_file=flake8_file)
     print(f"Generated flake8 statistics file '{flake8_file}'.")
 
 
-def check_bandit_security():
-    cmd = ["bandit", "-c", "pyproject.toml", "-r", package_name]
+def check_bandit_security(files=None):
+    cmd = ["bandit", "-c", "pyproject.toml"]
+    if files is None:
+        cmd += ["-r", package_name]
+    else:
+        files = [file for file in files if file.startswith(package_name + "/")]
+        if not files:
+            print(f"Skipping security check as no files changed in '{package_name}'.")
+            return
+        cmd += files
     print(f"Checking security '{' '.join(cmd)}'.")
-    _ = run_cmd(cmd)
-
-
-def check_docstring_formatting():
-    cmd = ["pydocstyle", package_name, "--convention=numpy"]
+    run_cached("bandit", cmd, lint_inputs(files, package_name))
+
+
+def check_docstring_formatting(files=None):
+    cmd = ["pydocstyle", "--convention=numpy"]
+    if files is None:
+        cmd += [package_name]
+    else:
+        files = [file for file in files if file.startswith(package_name + "/")]
+        if not files:
+            print(f"Skipping docstring check as no files changed in '{package_name}'.")
+            return
+        cmd += files
     print(f"Checking docstring format '{' '.join(cmd)}'.")
-    _ = run_cmd(cmd)
+    run_cached("pydocstyle", cmd, lint_inputs(files, package_name))
 
 
 def run_docstring_pytest():
@@ -132,29 +296,25 @@ def generate_markdown_pytest():
         _ = run_cmd(cmd)
 
 
-def run_coverage_pytest():
+def run_coverage_pytest(args: dict):
     # required arguments
     cmd = [
         "coverage",
         "run",
+        "--parallel-mode",
         "--branch",
         f"--data-file={coverage_file}",
         "-m",
         f"--source={package_name}",
         "pytest",
         f"--junitxml={pytest_file}",
+        # shard by test module so tests sharing a global temporary table run in the same worker
+        # modules still run concurrently against one server, so ## table names must be unique to each module
+        f"-n={max(1, (os.cpu_count() or 1) - 2)}",
+        "--dist=loadfile",
     ]
 
     # add optional arguments defined by conftest.py options
-    sys.path.insert(1, os.path.join(sys.path[0], ".."))
-    from conftest import options
-
-    parser = argparse.ArgumentParser()
-    for opt in options:
-        parser.add_argument(opt, **options[opt])
-    args = parser.parse_args()
-    args = vars(args)
-    args = {k: v for k, v in args.items() if v is not None}
     cmd += ["--" + k + "=" + v for k, v in args.items()]
 
     # use coverage to call pytest
@@ -165,26 +325,29 @@ def run_coverage_pytest():
 
 
 def report_coverage_output():
-    _ = run_cmd(
+    # combine data files written by each parallel test worker
+    _ = run_inproc("coverage.cmdline", ["combine", f"--data-file={coverage_file}"])
+
+    _ = run_inproc(
+        "coverage.cmdline",
         [
-            "coverage",
             "html",
             f"--data-file={coverage_file}",
             f"--directory={coverage_dir}",
-        ]
+        ],
     )
 
     print(f"Generated coverage html file '{os.path.join(coverage_dir, 'index.html')}'.")
 
-    _ = run_cmd(
+    _ = run_inproc(
+        "coverage.cmdline",
         [
-            "coverage",
             "xml",
             f"--data-file={coverage_file}",
             "-o",
             f"{coverage_xml}",
             f"--fail-under={coverage_fail_under}",
-        ]
+        ],
     )
     print(f"Generated coverage xml file '{coverage_xml}'.")
 
@@ -195,10 +358,10 @@ def generage_package_badges():
         "coverage": coverage_xml,
         "flake8": flake8_file,
     }
-    for b, i in badges.items():
-        fp = f"{genbadge_dir}/{b}.svg"
-        _ = run_cmd(["genbadge", b, "-i", i, "-o", fp])
-        print(f"Generated badge for '{b}' at '{fp}'.")
+    jobs = [[b, "-i", i, "-o", f"{genbadge_dir}/{b}.svg"] for b, i in badges.items()]
+    _ = run_worker("genbadge.main", "genbadge", jobs)
+    for b in badges:
+        print(f"Generated badge for '{b}' at '{genbadge_dir}/{b}.svg'.")
 
 
 def check_package_version():
@@ -215,9 +378,17 @@ def build_python_package():
 
 
 def test_python_package():
-    # find build files
-    source = glob.glob(os.path.join(build_dir, "*.tar.gz"))[0]
-    wheel = glob.glob(os.path.join(build_dir, "*.whl"))[0]
+    # find build files in a single pass of the build directory
+    source = []
+    wheel = []
+    with os.scandir(build_dir) as entries:
+        for entry in entries:
+            if entry.name.endswith(".tar.gz"):
+                source.append(entry.path)
+            elif entry.name.endswith(".whl"):
+                wheel.append(entry.path)
+    source = source[0]
+    wheel = wheel[0]
 
     print(f"Built source archive '{source}'.")
     print(f"Built distributions '{wheel}'.")
@@ -225,19 +396,49 @@ def test_python_package():
     # check build result
     cmd = ["twine", "check", os.path.join(build_dir, "*")]
     print(f"Testing built package '{' '.join(cmd)}'")
-    _ = run_cmd(cmd)
+    _ = run_inproc("twine.__main__", cmd[1:])
 
 
-remove_output_dirs()
-check_black_formatting()
-check_flake8_style()
-check_bandit_security()
-check_docstring_formatting()
-run_docstring_pytest()
-generate_markdown_pytest()
-run_coverage_pytest()
-report_coverage_output()
-generage_package_badges()
-check_package_version()
-build_python_package()
-test_python_package()
+def parse_args() -> dict:
+    """Parse optional command line arguments defined by conftest.py options."""
+    sys.path.insert(1, os.path.join(sys.path[0], ".."))
+    from conftest import options
+
+    parser = argparse.ArgumentParser()
+    for opt in options:
+        parser.add_argument(opt, **options[opt])
+    args = parser.parse_args()
+    args = vars(args)
+    args = {k: v for k, v in args.items() if v is not None}
+
+    return args
+
+
+def main():
+    # parse arguments before any work so --help or invalid arguments exit immediately
+    args = parse_args()
+
+    remove_output_dirs()
+    # only lint files changed on this branch, otherwise lint everything
+    # flake8 always checks everything as its report is used for a badge
+    files = changed_python_files()
+    run_concurrent(
+        [
+            partial(check_black_formatting, files),
+            check_flake8_style,
+            partial(check_bandit_security, files),
+            partial(check_docstring_formatting, files),
+        ]
+    )
+    run_docstring_pytest()
+    generate_markdown_pytest()
+    run_coverage_pytest(args)
+    report_coverage_output()
+    generage_package_badges()
+    check_package_version()
+    build_python_package()
+    test_python_package()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,10 @@
 """Functions for data movement between Python pandas dataframes and SQL."""
 
 import struct
+import threading
+import time
+from datetime import date, datetime, timedelta
+from functools import partial, reduce
 from typing import Tuple, List
 import logging
 import pytz
@@ -20,6 +24,100 @@ pd.set_option("future.no_silent_downcasting", True)
 
 logger = logging.getLogger(__name__)
 
+# number of rows fetched at a time when reading from SQL
+fetch_size = 10000
+
+# number of rows sent at a time when writing to SQL
+insert_size = 2000
+
+# seconds a table schema is reused for the same connection and table name, 0 to always query
+# changes made through this library invalidate the schema, but DDL from raw SQL or another connection
+# isn't detected so the schema may be stale for up to schema_ttl seconds unless invalidate_schema is called
+schema_ttl = 60
+schema_cache_size = 256
+
+# schemas by id of connection as {id: (connection, {table_name: (time read, schema)})}
+# pyodbc connections don't support weak references, so the connection is held to detect a reused id
+# and entries are released once the connection is closed or its schemas expire
+_schema_cache = {}
+# guards _schema_cache as schemas may be read from several threads, such as by pool.read_many
+_schema_lock = threading.Lock()
+# time the cache was last swept for closed connections and expired schemas
+_schema_swept = 0.0
+
+
+def _table_key(table_name: str) -> str:
+    """Table name without a schema name, for matching different spellings of the same table."""
+    return table_name.split(".")[-1].lower()
+
+
+def invalidate_schema(connection: pyodbc.connect, table_name: str = None) -> None:
+    """Discard a cached table schema after the table definition changes.
+
+    Parameters
+    ----------
+    connection (pyodbc.connect) : connection the schema was read with
+    table_name (str, default=None) : table name the schema was read for, with or without a schema name, or None for all tables
+    """
+    with _schema_lock:
+        entry = _schema_cache.get(id(connection))
+        if entry is None:
+            return
+        if table_name is None or entry[0] is not connection:
+            del _schema_cache[id(connection)]
+            return
+        # discard every spelling of the table, such as with and without a schema name
+        key = _table_key(table_name)
+        for name in [x for x in entry[1] if _table_key(x) == key]:
+            del entry[1][name]
+
+
+def _cache_schema(connection: pyodbc.connect, table_name: str, schema: tuple) -> None:
+    """Store a schema read from SQL, releasing closed connections and expired or the oldest schemas.
+
+    Parameters
+    ----------
+    connection (pyodbc.connect) : connection the schema was read with
+    table_name (str) : table name the schema was read for
+    schema (tuple) : catalog, table_name, schema_name, and schema returned by _read_schema
+    """
+    global _schema_swept
+    now = time.monotonic()
+
+    with _schema_lock:
+        # only sweep once the cache is full or schemas may have expired, as each sweep visits every schema
+        size = sum(len(tables) for _, tables in _schema_cache.values())
+        limit = max(schema_cache_size, 1)
+        if size >= limit or now - _schema_swept >= schema_ttl:
+            _schema_swept = now
+
+            # release closed connections and expired schemas
+            for key, (cached, tables) in list(_schema_cache.items()):
+                for name in [x for x, y in tables.items() if now - y[0] >= schema_ttl]:
+                    del tables[name]
+                # older pyodbc versions don't report whether a connection is closed
+                closed = getattr(cached, "closed", False)
+                if closed or (not tables and cached is not connection):
+                    del _schema_cache[key]
+
+            # evict the oldest schemas to make room for the new schema
+            size = sum(len(tables) for _, tables in _schema_cache.values())
+            excess = size - limit + 1
+            if excess > 0:
+                oldest = sorted(
+                    (read, key, name)
+                    for key, (_, tables) in _schema_cache.items()
+                    for name, (read, _) in tables.items()
+                )
+                for _, key, name in oldest[0:excess]:
+                    del _schema_cache[key][1][name]
+
+        entry = _schema_cache.get(id(connection))
+        if entry is None or entry[0] is not connection:
+            entry = (connection, {})
+            _schema_cache[id(connection)] = entry
+        entry[1][table_name] = (now, schema)
+
 
 def get_schema(
     connection: pyodbc.connect,
@@ -45,38 +143,26 @@ def get_schema(
     schema (pandas.DataFrame) : table column specifications and conversion rules
     dataframe (pandas.DataFrame) : dataframe with contents converted to conform to SQL data type
     """
-    cursor = connection.cursor()
-
-    # add cataglog for temporary tables
-    try:
-        schema_name, table_name = table_name.split(".")
-    except ValueError as err:
-        if err.args[0].startswith("not enough values to unpack"):
-            schema_name = None
-        else:  # pragma: no cover
-            raise
-    if table_name.startswith("#"):
-        catalog = "tempdb"
+    # reuse a recently read schema for the same connection and table
+    with _schema_lock:
+        entry = _schema_cache.get(id(connection))
+        cached = None
+        if entry is not None and entry[0] is connection:
+            cached = entry[1].get(table_name)
+    if cached is not None and time.monotonic() - cached[0] < schema_ttl:
+        catalog, table_name, schema_name, schema = cached[1]
+        schema = schema.copy()
     else:
-        catalog = None
+        result = _read_schema(connection, table_name)
+        _cache_schema(connection, table_name, result[0:3] + (result[3].copy(),))
+        catalog, table_name, schema_name, schema = result
 
-    # get schema
-    schema = []
-    cursor = cursor.columns(table=table_name, catalog=catalog, schema=schema_name)
-    for col in cursor:
-        schema.append(list(col))
-    schema = pd.DataFrame(schema, columns=[x[0] for x in cursor.description])
-    # check for no SQL table
-    if len(schema) == 0:
-        raise custom_errors.SQLTableDoesNotExist(
-            f"catalog = {catalog}, table_name = {table_name}, schema_name={schema_name}"
-        )
     # check for missing columns not expected to be in dataframe
     # such as include_metadata_timestamps columns like _time_insert or _time_update
     # perform check seperately to insure this is raised without other dataframe columns
     if additional_columns is not None:
         columns = pd.Series(additional_columns, dtype="string")
-        missing = columns[~columns.isin(schema["column_name"])]
+        missing = columns[~columns.isin(schema.index)]
         if len(missing) > 0:
             missing = list(missing)
             raise custom_errors.SQLColumnDoesNotExist(
@@ -86,13 +172,71 @@ def get_schema(
     # check for other missing columns
     if dataframe is not None:
         columns = dataframe.columns
-        missing = columns[~columns.isin(schema["column_name"])]
+        missing = columns[~columns.isin(schema.index)]
         if len(missing) > 0:
             missing = list(missing)
             raise custom_errors.SQLColumnDoesNotExist(
                 f"catalog = {catalog}, table_name = {table_name}, columns={missing}",
                 missing,
             )
+
+    # check for undefined conversion rule
+    missing = schema[conversion_rules.rules.columns].isna().any(axis="columns")
+    if any(missing):
+        missing = missing[missing].index.tolist()
+        raise custom_errors.UndefinedConversionRule(
+            "SQL data type conversion to pandas is not defined for columns:", missing
+        )
+
+    # check contents of dataframe against SQL schema & convert
+    if dataframe is not None:
+        dataframe = _precheck_dataframe(schema, dataframe)
+
+    return schema, dataframe
+
+
+def _read_schema(
+    connection: pyodbc.connect, table_name: str
+) -> Tuple[str, str, str, pd.DataFrame]:
+    """Read the schema of an SQL table and merge the conversion rules.
+
+    Parameters
+    ----------
+    connection (pyodbc.connect) : connection to database
+    table_name (str) : table name to read schema from
+
+    Returns
+    -------
+    catalog (str) : catalog of the table, tempdb for temporary tables
+    table_name (str) : table name without schema name
+    schema_name (str) : schema name if specified in table_name
+    schema (pandas.DataFrame) : table column specifications and conversion rules
+    """
+    cursor = connection.cursor()
+
+    # add cataglog for temporary tables
+    try:
+        schema_name, table_name = table_name.split(".")
+    except ValueError as err:
+        if err.args[0].startswith("not enough values to unpack"):
+            schema_name = None
+        else:  # pragma: no cover
+            raise
+    if table_name.startswith("#"):
+        catalog = "tempdb"
+    else:
+        catalog = None
+
+    # get schema, building the dataframe directly from the rows
+    cursor = cursor.columns(table=table_name, catalog=catalog, schema=schema_name)
+    schema = pd.DataFrame.from_records(
+        map(tuple, cursor), columns=[x[0] for x in cursor.description]
+    )
+    # check for no SQL table
+    if len(schema) == 0:
+        raise custom_errors.SQLTableDoesNotExist(
+            f"catalog = {catalog}, table_name = {table_name}, schema_name={schema_name}"
+        )
     # format schema
     schema = schema.rename(columns={"type_name": "sql_type"})
     schema = schema[
@@ -114,8 +258,10 @@ def get_schema(
     schema["ss_is_identity"] = schema["ss_is_identity"] == 1
 
     # add primary key info
-    pk = cursor.primaryKeys(table=table_name, catalog=catalog).fetchall()
-    pk = pd.DataFrame([list(x) for x in pk], columns=[x[0] for x in cursor.description])
+    cursor = cursor.primaryKeys(table=table_name, catalog=catalog)
+    pk = pd.DataFrame.from_records(
+        map(tuple, cursor), columns=[x[0] for x in cursor.description]
+    )
     pk = pk.rename(columns={"key_seq": "pk_seq"})
     schema = schema.merge(
         pk[["column_name", "pk_seq", "pk_name"]],
@@ -134,21 +280,11 @@ def get_schema(
     )
     schema.loc[identity, "sql_type"] = "int identity"
 
-    # key column_name as index, check for undefined conversion rule
+    # key column_name as index
     schema["column_name"] = schema["column_name"].astype("string")
     schema = schema.set_index(keys="column_name")
-    missing = schema[conversion_rules.rules.columns].isna().any(axis="columns")
-    if any(missing):
-        missing = missing[missing].index.tolist()
-        raise custom_errors.UndefinedConversionRule(
-            "SQL data type conversion to pandas is not defined for columns:", missing
-        )
-
-    # check contents of dataframe against SQL schema & convert
-    if dataframe is not None:
-        dataframe = _precheck_dataframe(schema, dataframe)
 
-    return schema, dataframe
+    return catalog, table_name, schema_name, schema
 
 
 def _precheck_dataframe(schema: pd.DataFrame, dataframe: pd.DataFrame) -> pd.DataFrame:
@@ -183,9 +319,18 @@ def _precheck_dataframe(schema: pd.DataFrame, dataframe: pd.DataFrame) -> pd.Dat
     # check if unicode to a nonunicode type
     check_unicode(dataframe, schema)
 
-    # convert dataframe based on SQL type
+    # convert dataframe based on SQL type, skipping columns already of that type
+    dtypes = {
+        col: pandas_type
+        for col, pandas_type in schema["pandas_type"].items()
+        if str(dataframe[col].dtype) != pandas_type
+    }
     try:
-        dataframe = dataframe.astype(schema["pandas_type"].to_dict())
+        if dtypes:
+            dataframe = dataframe.astype(dtypes)
+        else:
+            # copy regardless so preparing values never alters the caller's dataframe
+            dataframe = dataframe.copy()
     except TypeError:  # pragma: no cover
         raise custom_errors.DataframeColumnInvalidValue(
             "Dataframe columns cannot be converted based on their SQL data type"
@@ -203,36 +348,49 @@ def _precheck_dataframe(schema: pd.DataFrame, dataframe: pd.DataFrame) -> pd.Dat
 def convert_largest_sql_category(dataframe, schema):
     """Convert objects to allow for comparison without truncation."""
     # avoids downcast such as UInt8 value of 10000 to 16
-    convert = dataframe.columns[dataframe.dtypes == "object"]
+    # classify object columns by SQL category in a single pass
+    convert = {
+        "exact_whole_numeric": [],
+        "approximate_decimal_numeric": [],
+        "date_time": [],
+        "datetimeoffset": [],
+        "character string": [],
+    }
+    for col, dtype in dataframe.dtypes.items():
+        if dtype != "object":
+            continue
+        category = schema.at[col, "sql_category"]
+        if category == "date_time" and schema.at[col, "sql_type"] == "datetimeoffset":
+            category = "datetimeoffset"
+        if category in convert:
+            convert[category].append(col)
     try:
         # exact_whole_numeric
-        columns = convert[schema.loc[convert, "sql_category"] == "exact_whole_numeric"]
-        # BUG: first convert to float after replacing pandas.NA
-        # https://github.com/pandas-dev/pandas/issues/25472
-        dataframe[columns] = dataframe[columns].fillna(np.nan).replace([np.nan], [None])
-        dataframe[columns] = dataframe[columns].astype("float")
-        dataframe[columns] = dataframe[columns].astype("Int64")
+        columns = convert["exact_whole_numeric"]
+        if columns:
+            # BUG: first convert to float after replacing pandas.NA
+            # https://github.com/pandas-dev/pandas/issues/25472
+            dataframe[columns] = (
+                dataframe[columns].fillna(np.nan).replace([np.nan], [None])
+            )
+            dataframe[columns] = dataframe[columns].astype("float")
+            dataframe[columns] = dataframe[columns].astype("Int64")
         # approximate_decimal_numeric
-        columns = convert[
-            schema.loc[convert, "sql_category"] == "approximate_decimal_numeric"
-        ]
-        dataframe[columns] = dataframe[columns].astype("float64")
+        columns = convert["approximate_decimal_numeric"]
+        if columns:
+            dataframe[columns] = dataframe[columns].astype("float64")
         # date_time
-        columns = convert[
-            (schema.loc[convert, "sql_category"] == "date_time")
-            & (schema.loc[convert, "sql_type"] != "datetimeoffset")
-        ]
-        dataframe[columns] = dataframe[columns].astype("datetime64[ns]")
+        columns = convert["date_time"]
+        if columns:
+            dataframe[columns] = dataframe[columns].astype("datetime64[ns]")
         # datetime offset
-        columns = convert[
-            (schema.loc[convert, "sql_category"] == "date_time")
-            & (schema.loc[convert, "sql_type"] == "datetimeoffset")
-        ]
+        columns = convert["datetimeoffset"]
         for col in columns:
             dataframe[col] = dataframe[col].apply(lambda x: pd.Timestamp(x))
         # character string
-        columns = convert[schema.loc[convert, "sql_category"] == "character string"]
-        dataframe[columns] = dataframe[columns].astype("string")
+        columns = convert["character string"]
+        if columns:
+            dataframe[columns] = dataframe[columns].astype("string")
     except (TypeError, ValueError):  # pragma: no cover
         raise custom_errors.DataframeColumnInvalidValue(
             "Dataframe columns cannot be converted based on their SQL data type",
@@ -242,6 +400,15 @@ def convert_largest_sql_category(dataframe, schema):
     return dataframe
 
 
+def _length_range(series: pd.Series) -> Tuple[int, int]:
+    """Minimum and maximum length of non-null values such as bytes, or NA if all values are null."""
+    lengths = list(map(len, series.dropna().to_numpy()))
+    if not lengths:
+        return pd.NA, pd.NA
+
+    return min(lengths), max(lengths)
+
+
 def check_column_size(dataframe, schema):
     """Raise exception if dataframe value is too large for SQL data type specification."""
     check = dataframe.copy()
@@ -256,7 +423,6 @@ def check_column_size(dataframe, schema):
     binary = schema.index[schema["sql_category"] == "binary"]
     if any(binary):
         schema.loc[binary, "max_value"] = schema.loc[binary, "column_size"]
-        check[binary] = check[binary].apply(lambda x: x.str.len()).astype("Int64")
 
     standard = check.drop(columns=list(datetimeoffset) + list(binary))
     if len(standard.columns) == 0:  # pragma: no cover
@@ -278,14 +444,12 @@ def check_column_size(dataframe, schema):
 
     # calculate min/max for binary seperately
     for col in binary:
+        minimum, maximum = _length_range(dataframe[col])
         check = pd.concat(
             [
                 check,
                 pd.DataFrame(
-                    {
-                        "min": min(dataframe[col].str.len()),
-                        "max": max(dataframe[col].str.len()),
-                    },
+                    {"min": minimum, "max": maximum},
                     index=[col],
                     dtype="Int64",
                 ),
@@ -358,33 +522,82 @@ def prepare_cursor(
     -------
     cursor (pyodbc.connect.cursor) : cursor with SQL data type and size parameters set
     """
-    schema = schema[
-        [
-            "column_size",
-            "decimal_digits",
-            "min_value",
-            "max_value",
-            "sql_category",
-            "sql_type",
-            "odbc_type",
-        ]
-    ]
-
     # insure columns are sorted correctly
     columns = list(dataframe.columns)
     index = dataframe.index.names
     if any(index):
         columns = list(index) + columns
-    schema = schema.loc[columns]
 
     # set SQL data type and size for cursor
-    schema = schema[["odbc_type", "column_size", "decimal_digits"]].to_numpy().tolist()
-    schema = [tuple(x) for x in schema]
+    schema = list(
+        schema.loc[columns, ["odbc_type", "column_size", "decimal_digits"]].itertuples(
+            index=False, name=None
+        )
+    )
     cursor.setinputsizes(schema)
 
     return cursor
 
 
+def _format_time(series: pd.Series) -> np.ndarray:
+    """Format timedelta values as SQL TIME strings with up to 7 decimal places, such as 23:59:59.1234567."""
+    values = series.to_numpy(dtype="timedelta64[ns]")
+    # 100 nanosecond increments for the 7 decimal places allowed by SQL
+    ticks = values.view("int64") // 100
+    hours, ticks = np.divmod(ticks, 36_000_000_000)
+    minutes, ticks = np.divmod(ticks, 600_000_000)
+    seconds, fraction = np.divmod(ticks, 10_000_000)
+    formatted = reduce(
+        np.char.add,
+        [
+            np.char.zfill(hours.astype(str), 2),
+            ":",
+            np.char.zfill(minutes.astype(str), 2),
+            ":",
+            np.char.zfill(seconds.astype(str), 2),
+        ],
+    )
+    # fraction is omitted when zero and has 6 decimal places when exact to the microsecond, the same as pandas.Timedelta
+    microseconds, remainder = np.divmod(fraction, 10)
+    formatted = np.where(
+        fraction == 0,
+        formatted,
+        np.char.add(
+            np.char.add(formatted, "."),
+            np.where(
+                remainder == 0,
+                np.char.zfill(microseconds.astype(str), 6),
+                np.char.zfill(fraction.astype(str), 7),
+            ),
+        ),
+    )
+    formatted = np.where(np.isnat(values), None, formatted.astype(object))
+
+    return formatted
+
+
+def _format_datetime(series: pd.Series, decimals: int = 7) -> np.ndarray:
+    """Format datetime values as SQL strings such as 2021-01-01 23:59:59.1234567, with 7 decimal places for DATETIME2 or 3 for DATETIME."""
+    values = series.to_numpy(dtype="datetime64[ns]")
+    seconds = np.char.replace(np.datetime_as_string(values, unit="s"), "T", " ")
+    fraction = values.view("int64") % 1_000_000_000 // 10 ** (9 - decimals)
+    formatted = np.char.add(
+        np.char.add(seconds, "."), np.char.zfill(fraction.astype(str), decimals)
+    )
+    formatted = np.where(np.isnat(values), None, formatted.astype(object))
+
+    return formatted
+
+
+# convert to string since python datetime.time/datetime allow 6 decimal places but SQL allows 7
+# DATETIME parameters are bound with 3 decimal places, so DATETIME values are formatted to milliseconds
+_formatters = {
+    "time": _format_time,
+    "datetime": partial(_format_datetime, decimals=3),
+    "datetime2": _format_datetime,
+}
+
+
 def prepare_time(schema, prepped, dataframe):
     """Prepare time for writting to SQL."""
     dtype = schema[schema["sql_type"] == "time"].index
@@ -425,12 +638,6 @@ def prepare_time(schema, prepped, dataframe):
         )
         dataframe[col] = rounded
         prepped[col] = rounded
-    if any(dtype):
-        # convert to string since python datetime.time allows 6 decimal places but SQL allows 7
-        prepped[dtype] = prepped[dtype].astype("str")
-        prepped[dtype] = prepped[dtype].replace({"NaT": None})
-        prepped[dtype] = prepped[dtype].apply(lambda x: x.str[7:23])
-
     return prepped, dataframe
 
 
@@ -463,12 +670,6 @@ def prepare_datetime(schema, prepped, dataframe):
             dataframe[col] = rounded
             prepped[col] = rounded
 
-    if any(dtype):
-        # convert to string since python datetime.datetime allows 6 decimals but SQL allows 7
-        prepped[dtype] = prepped[dtype].astype("str")
-        prepped[dtype] = prepped[dtype].replace({"NaT": None})
-        prepped[dtype] = prepped[dtype].apply(lambda x: x.str[0:27])
-
     return prepped, dataframe
 
 
@@ -505,12 +706,6 @@ def prepare_datetime2(schema, prepped, dataframe):
             rounded = rounded.astype("datetime64[ns]")
             dataframe[col] = rounded
             prepped[col] = rounded
-    if any(dtype):
-        # convret to string since python datetime.datetime allows 6 decimals but SQL allows 7
-        prepped[dtype] = prepped[dtype].astype("str")
-        prepped[dtype] = prepped[dtype].replace({"NaT": None})
-        prepped[dtype] = prepped[dtype].apply(lambda x: x.str[0:27])
-
     return prepped, dataframe
 
 
@@ -588,7 +783,9 @@ def prepare_numeric(schema, prepped, dataframe):
         prepped[col] = dataframe[col].apply(
             lambda x: round(x, decimal_digits) if pd.notna(x) else x
         )
-        prepped[col] = prepped[col].astype(dataframe[col].dtype)
+        # restore the original type only if apply inferred a different one
+        if prepped[col].dtype != dataframe[col].dtype:
+            prepped[col] = prepped[col].astype(dataframe[col].dtype)
         if not dataframe[col].equals(prepped[col]):
             msg = f"Decimal digits for column [{col}] will be rounded to {decimal_digits} decimal places to fit SQL specification for this column."
             logger.warning(msg)
@@ -625,18 +822,16 @@ def prepare_values(
     values (list) : values to pass to pyodbc.connect.cursor.executemany
 
     """
-    # create a copy to preserve values in return
-    prepped = dataframe.copy()
-
     # include index as column as it is the primary key
     # also retain the origional index for dataframe/series comparisons
-    index = prepped.index.names
+    index = dataframe.index.names
     if any(index):
-        prepped = prepped.reset_index()
-        prepped = prepped.set_index(index, drop=False)
         dataframe = dataframe.reset_index()
         dataframe = dataframe.set_index(index, drop=False)
 
+    # create a copy to preserve values in return
+    prepped = dataframe.copy()
+
     # only prepare values currently in dataframe
     schema = schema[schema.index.isin(prepped.columns)]
 
@@ -652,21 +847,25 @@ def prepare_values(
     if any(index):
         dataframe = dataframe.set_index(index)
 
-    # treat pandas NA,NaT,etc as NULL in SQL
-    # prepped = prepped.fillna(np.nan).replace([np.nan], [None])
-
-    # # convert single column of datetime to objects
-    # # otherwise tolist() will produce ints instead of datetimes
-    # if prepped.shape[1] == 1 and prepped.select_dtypes("datetime").shape[1] == 1:
-    #     prepped = prepped.astype(object)
-
-    # BUG: treat pandas NA,NaT,etc as NULL in SQL
-    # ideally we woudn't want to convert everything to an object
-    prepped = prepped.astype(object)
-    prepped = prepped.where(pd.notnull(prepped), None)
+    # format and treat pandas NA,NaT,etc as NULL in SQL in a single pass over each column
+    values = np.empty(prepped.shape, dtype=object)
+    for idx, col in enumerate(prepped.columns):
+        column = prepped.iloc[:, idx]
+        sql_type = schema.at[col, "sql_type"] if col in schema.index else None
+        if sql_type in _formatters:
+            values[:, idx] = _formatters[sql_type](column)
+        else:
+            # use the native missing value mask before boxing values as objects
+            missing = column.isna().to_numpy()
+            if missing.all():
+                values[:, idx] = None
+            elif missing.any():
+                values[:, idx] = np.where(missing, None, column.to_numpy(dtype=object))
+            else:
+                values[:, idx] = column.to_numpy(dtype=object)
 
     # values for pyodbc cursor executemany
-    values = prepped.values.tolist()
+    values = values.tolist()
 
     return dataframe, values
 
@@ -678,20 +877,18 @@ def convert_time(connection):
     pyodbc "SQL_SS_TIME2" = T-SQL "TIME"
 
     python datetime.time has 6 decimal places of precision and isn't nullable
-    pandas Timedelta supports 9 decimal places and is nullable
+    numpy timedelta64[ns] supports 9 decimal places and is nullable in pandas
     SQL TIME only supports 7 decimal places for precision
     SQL TIME range is '00:00:00.0000000' to '23:59:59.9999999' while pandas allows multiple days and negatives
     """
 
-    def SQL_SS_TIME2(raw_bytes, pattern=struct.Struct("<4hI")):
+    def SQL_SS_TIME2(
+        raw_bytes, pattern=struct.Struct("<4hI"), timedelta64=np.timedelta64
+    ):
         hour, minute, second, _, fraction = pattern.unpack(raw_bytes)
-        return pd.Timedelta(
-            hours=hour,
-            minutes=minute,
-            seconds=second,
-            microseconds=fraction // 1000,
-            nanoseconds=fraction % 1000,
-        )
+        # build nanoseconds directly to avoid the overhead of parsing pandas.Timedelta keywords
+        nanoseconds = ((hour * 60 + minute) * 60 + second) * 1_000_000_000 + fraction
+        return timedelta64(nanoseconds, "ns")
 
     connection.add_output_converter(pyodbc.SQL_SS_TIME2, SQL_SS_TIME2)
 
@@ -704,7 +901,7 @@ def convert_timestamp(connection):
 
     Types: pyodbc "SQL_TYPE_TIMESTAMP" = T-SQL "DATETIME2" or pyodbc "SQL_TYPE_TIMESTAMP" =  T-SQL "DATETIME"
     python datetime.datetime has 6 decimal places of precision and isn't nullable
-    pandas Timestamp supports 9 decimal places and is nullable
+    numpy datetime64[ns] supports 9 decimal places and is nullable in pandas
     SQL DATETIME2 only supports 7 decimal places for precision
     SQL DATETIME only supports 3 decimal places for precision in rounded increments of .000, .003, or .007 seconds
     pandas Timestamp range range is '1677-09-21 00:12:43.145225' to '2262-04-11 23:47:16.854775807'
@@ -712,30 +909,42 @@ def convert_timestamp(connection):
     DATETIME allows '1753-01-01' through '9999-12-31'
     """
 
-    def SQL_TYPE_TIMESTAMP(raw_bytes):
+    def SQL_TYPE_TIMESTAMP(
+        raw_bytes,
+        pattern_datetime2=struct.Struct("hHHHHHI"),
+        pattern_datetime=struct.Struct("iI"),
+        datetime64=np.datetime64,
+        toordinal=date.toordinal,
+        epoch=date(1970, 1, 1).toordinal(),
+    ):
+        # build nanoseconds since epoch directly to avoid the overhead of parsing pandas.Timestamp keywords
         # DATETIME2 (16 bytes)
         if len(raw_bytes) == 16:
-            pattern = struct.Struct("hHHHHHI")
-            year, month, day, hour, minute, second, fraction = pattern.unpack(raw_bytes)
-            timestamp = pd.Timestamp(
-                year=year,
-                month=month,
-                day=day,
-                hour=hour,
-                minute=minute,
-                second=second,
-                microsecond=fraction // 1000,
-                nanosecond=fraction % 1000,
+            year, month, day, hour, minute, second, fraction = pattern_datetime2.unpack(
+                raw_bytes
             )
-        # DATETIME (8 bytes)
+            days = toordinal(date(year, month, day)) - epoch
+            seconds = ((days * 24 + hour) * 60 + minute) * 60 + second
+            nanoseconds = seconds * 1_000_000_000 + fraction
+        # DATETIME (8 bytes), days since 1900-01-01 and ticks of 1/300 second
         else:
-            pattern = struct.Struct("iI")
-            days, ticks = pattern.unpack(raw_bytes)
-            timestamp = pd.Timestamp(year=1900, month=1, day=1) + pd.Timedelta(
-                days=days, milliseconds=round(3.33333333 * ticks)
-            )
+            days, ticks = pattern_datetime.unpack(raw_bytes)
+            milliseconds = round(3.33333333 * ticks)
+            nanoseconds = (
+                days + toordinal(date(1900, 1, 1)) - epoch
+            ) * 86_400_000_000_000 + milliseconds * 1_000_000
 
-        return timestamp
+        try:
+            return datetime64(nanoseconds, "ns")
+        except OverflowError:
+            # outside of the pandas Timestamp range, return datetime so read_values can name the column
+            if len(raw_bytes) == 16:
+                return datetime(
+                    year, month, day, hour, minute, second, fraction // 1000
+                )
+            return datetime(1900, 1, 1) + timedelta(
+                days=days, milliseconds=milliseconds
+            )
 
     connection.add_output_converter(pyodbc.SQL_TYPE_TIMESTAMP, SQL_TYPE_TIMESTAMP)
 
@@ -855,8 +1064,8 @@ def insert_values(
         columns = dataframe.columns
 
     # dynamic SQL object names
-    table = dynamic.escape(cursor, table_name)
-    columns = dynamic.escape(cursor, columns)
+    table = dynamic.escape(None, table_name)
+    columns = dynamic.escape(None, columns)
 
     # prepare values of dataframe for insert
     dataframe, values = prepare_values(schema, dataframe)
@@ -882,8 +1091,16 @@ def insert_values(
     )
     """  # nosec hardcoded_sql_expressions
 
-    print(f'Insert statement {statement}')
-    cursor.executemany(statement, values)
+    # an empty dataframe raises the same error as pyodbc does when executemany has no values
+    if len(values) == 0:
+        raise pyodbc.ProgrammingError(
+            "The second parameter to executemany must not be empty."
+        )
+
+    # send values in batches within a single transaction as autocommit is False
+    for start in range(0, len(values), insert_size):
+        end = start + insert_size
+        cursor.executemany(statement, values[start:end])
     cursor.commit()
 
     # values that may be altered to conform to SQL precision limitations
@@ -914,30 +1131,58 @@ def read_values(
 
     # read data from SQL
     if args is None:
-        result = cursor.execute(statement).fetchall()
+        cursor.execute(statement)
     else:
-        result = cursor.execute(statement, *args).fetchall()
-    columns = pd.Series([col[0] for col in cursor.description])
+        cursor.execute(statement, *args)
+    columns = [col[0] for col in cursor.description]
 
     # form output using SQL schema and explicit pandas types
-    if any(~columns.isin(schema.index)):
-        columns = list(columns[~columns.isin(schema.index)])
-        raise AttributeError(f"missing columns from schema: {columns}")
-    dtypes = schema.loc[columns, "pandas_type"].to_dict()
-    result = {col: [row[idx] for row in result] for idx, col in enumerate(columns)}
-    result = {col: pd.Series(vals, dtype=dtypes[col]) for col, vals in result.items()}
-    result = pd.DataFrame(result)
-
-    # replace missing values in object columns with pandas type
-    datetimeoffset = schema.index[schema["sql_type"] == "datetimeoffset"]
-    result[datetimeoffset] = result[datetimeoffset].fillna(pd.NaT)
+    pandas_type = schema["pandas_type"].to_dict()
+    missing = [col for col in columns if col not in pandas_type]
+    if missing:
+        raise AttributeError(f"missing columns from schema: {missing}")
+    dtypes = {col: pandas_type[col] for col in columns}
+    # object columns that use pandas.NaT instead of None for missing values
+    datetimeoffset = set(schema.index[schema["sql_type"] == "datetimeoffset"])
+
+    # fetch rows in batches, converting each to pandas types so only one batch
+    # of pyodbc rows and Python objects is held in memory at once
+    chunks = []
+    while True:
+        rows = cursor.fetchmany(fetch_size)
+        if not rows:
+            break
+        # transpose rows into columns
+        chunk = {}
+        for col, values in zip(columns, zip(*rows)):
+            if col in datetimeoffset:
+                values = [pd.NaT if v is None else v for v in values]
+            try:
+                chunk[col] = pd.Series(values, dtype=dtypes[col])
+            except pd.errors.OutOfBoundsDatetime as err:
+                raise ValueError(
+                    f"column {col} contains a value outside of the pandas Timestamp range: {err}"
+                ) from err
+        chunks.append(pd.DataFrame(chunk))
+    if len(chunks) == 0:
+        result = pd.DataFrame(
+            {col: pd.Series([], dtype=dtypes[col]) for col in columns}
+        )
+    elif len(chunks) == 1:
+        result = chunks[0]
+    else:
+        result = pd.concat(chunks, ignore_index=True)
 
-    # set primary key columns as index
+    # set primary key columns as index, moving the columns instead of copying them
     keys = list(schema[schema["pk_seq"].notna()].index)
     if keys:
-        try:
-            result = result.set_index(keys=keys)
-        except KeyError:
+        if any(key not in result.columns for key in keys):
             raise KeyError(f"primary key column missing from query: {keys}")
+        if len(keys) == 1:
+            result.index = pd.Index(result.pop(keys[0]), name=keys[0], copy=False)
+        else:
+            result.index = pd.MultiIndex.from_arrays(
+                [result.pop(key) for key in keys], names=keys
+            )
 
     return result
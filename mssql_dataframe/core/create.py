@@ -1,14 +1,35 @@
 """Methods for creating SQL tables both explicitly and implicitly."""
 
 from typing import List, Dict
+import io
 import logging
 
 import pyodbc
 
-from mssql_dataframe.core import dynamic
+from mssql_dataframe.core import dynamic, conversion
 
 logger = logging.getLogger(__name__)
 
+# pieces of the create table statement, written around the generated syntax for each table
+_statement_start = """
+        DECLARE @SQLStatement AS NVARCHAR(MAX);
+        """
+_statement_table = """
+        SET @SQLStatement = N'CREATE TABLE """
+_statement_columns = """ ('+
+        """
+_statement_pk = """
+        """
+_statement_parameters = """
+        +');'
+        EXEC sp_executesql
+        @SQLStatement,
+        N'"""
+_statement_values = """',
+        """
+_statement_end = """;
+        """
+
 
 class create:
     """Class for creating SQL tables both explicitly and implicitly."""
@@ -61,19 +82,6 @@ class create:
 
         >>> create.table(table_name='##ExampleCreateIdentityPKTable', columns={"A": "VARCHAR(100)", "B": "INT"}, not_nullable="B", sql_primary_key=True)
         """
-        statement = """
-        DECLARE @SQLStatement AS NVARCHAR(MAX);
-        {declare}
-        SET @SQLStatement = N'CREATE TABLE {table} ('+
-        {syntax}
-        {pk}
-        +');'
-        EXEC sp_executesql
-        @SQLStatement,
-        N'{parameters}',
-        {values};
-        """
-
         # check inputs
         if sql_primary_key and primary_key_column is not None:
             raise ValueError(
@@ -81,17 +89,14 @@ class create:
             )
         if isinstance(not_nullable, str):
             not_nullable = [not_nullable]
+        not_nullable = frozenset(not_nullable)
         if isinstance(primary_key_column, str):
             primary_key_column = [primary_key_column]
 
         # parse inputs
-        table_name = dynamic.escape(self._connection.cursor(), table_name)
+        table = dynamic.escape(None, table_name)
         column_names = list(columns.keys())
-        alias_names = [str(x) for x in list(range(0, len(column_names)))]
         size, dtypes_sql = dynamic.column_spec(columns.values())
-        size_vars = [
-            alias_names[idx] if x is not None else None for idx, x in enumerate(size)
-        ]
 
         if primary_key_column is not None:
             missing = [x for x in primary_key_column if x not in columns]
@@ -99,116 +104,78 @@ class create:
                 raise KeyError(
                     "primary_key_column is not in input varble columns", missing
                 )
-            alias_pk = [str(x) for x in list(range(0, len(primary_key_column)))]
-        else:
-            alias_pk = []
-
-        # develop syntax for SQL variable declaration
-        declare = list(
-            zip(
-                ["DECLARE @ColumnName_" + x + " SYSNAME = ?;" for x in alias_names],
-                ["DECLARE @ColumnType_" + x + " SYSNAME = ?;" for x in alias_names],
-                [
-                    (
-                        "DECLARE @ColumnSize_" + x + " SYSNAME = ?;"
-                        if x is not None
-                        else ""
-                    )
-                    for x in size_vars
-                ],
-            )
-        )
-        declare = "\n".join(["\n".join(x) for x in declare])
-        if primary_key_column is not None:
-            declare += "\n" + "\n".join(
-                ["DECLARE @PK_" + x + " SYSNAME = ?;" for x in alias_pk]
-            )
 
-        # develop syntax for SQL table creation
-        syntax = list(
-            zip(
-                ["QUOTENAME(@ColumnName_" + x + ")" for x in alias_names],
-                ["QUOTENAME(@ColumnType_" + x + ")" for x in alias_names],
-                ["@ColumnSize_" + x + "" if x is not None else "" for x in size_vars],
-                ["'NOT NULL'" if x in not_nullable else "" for x in column_names],
-            )
-        )
-        syntax = "+','+\n".join(
-            ["+' '+".join([x for x in col if len(x) > 0]) for col in syntax]
-        )
+        # develop syntax for SQL variable declaration, table creation, sp_executesql parameters/values
+        # and the variables for the execute method
+        declare = []
+        syntax = []
+        parameters = []
+        values = []
+        args = []
+        for alias, name in enumerate(column_names):
+            declare += [
+                f"DECLARE @ColumnName_{alias} SYSNAME = ?;",
+                f"DECLARE @ColumnType_{alias} SYSNAME = ?;",
+            ]
+            column = [
+                f"QUOTENAME(@ColumnName_{alias})",
+                f"QUOTENAME(@ColumnType_{alias})",
+            ]
+            parameters += [
+                f"@ColumnName_{alias} SYSNAME",
+                f"@ColumnType_{alias} SYSNAME",
+            ]
+            values += [
+                f"@ColumnName_{alias}=@ColumnName_{alias}",
+                f"@ColumnType_{alias}=@ColumnType_{alias}",
+            ]
+            args += [name, dtypes_sql[alias]]
+            if size[alias] is not None:
+                declare.append(f"DECLARE @ColumnSize_{alias} SYSNAME = ?;")
+                column.append(f"@ColumnSize_{alias}")
+                parameters.append(f"@ColumnSize_{alias} VARCHAR(MAX)")
+                values.append(f"@ColumnSize_{alias}=@ColumnSize_{alias}")
+                args.append(size[alias])
+            if name in not_nullable:
+                column.append("'NOT NULL'")
+            syntax.append("+' '+".join(column))
+
+        syntax = "+','+\n".join(syntax)
 
         # primary key syntax
         pk = ""
         if sql_primary_key:
             syntax = "'_pk INT NOT NULL IDENTITY(1,1) PRIMARY KEY,'+\n" + syntax
         elif primary_key_column is not None:
-            pk = "+','+".join(["QUOTENAME(@PK_" + x + ")" for x in alias_pk])
-            pk = "+\n',PRIMARY KEY ('+" + pk + "+')'"
-
-        # develop syntax for sp_executesql parameters
-        parameters = list(
-            zip(
-                ["@ColumnName_" + x + " SYSNAME" for x in alias_names],
-                ["@ColumnType_" + x + " SYSNAME" for x in alias_names],
-                [
-                    "@ColumnSize_" + x + " VARCHAR(MAX)" if x is not None else ""
-                    for x in size_vars
-                ],
-            )
-        )
-        parameters = [
-            ", ".join([item for item in sublist if len(item) > 0])
-            for sublist in parameters
-        ]
+            pk = []
+            for alias in range(len(primary_key_column)):
+                declare.append(f"DECLARE @PK_{alias} SYSNAME = ?;")
+                parameters.append(f"@PK_{alias} SYSNAME")
+                values.append(f"@PK_{alias}=@PK_{alias}")
+                pk.append(f"QUOTENAME(@PK_{alias})")
+            pk = "+\n',PRIMARY KEY ('+" + "+','+".join(pk) + "+')'"
+
+        declare = "\n".join(declare)
         parameters = ", ".join(parameters)
-        if primary_key_column is not None:
-            parameters += ", " + ", ".join(["@PK_" + x + " SYSNAME" for x in alias_pk])
-
-        # create input for sp_executesql SQL syntax
-        values = list(
-            zip(
-                [
-                    "@ColumnName_" + x + "" + "=@ColumnName_" + x + ""
-                    for x in alias_names
-                ],
-                [
-                    "@ColumnType_" + x + "" + "=@ColumnType_" + x + ""
-                    for x in alias_names
-                ],
-                [
-                    (
-                        "@ColumnSize_" + x + "" + "=@ColumnSize_" + x + ""
-                        if x is not None
-                        else ""
-                    )
-                    for x in size_vars
-                ],
-            )
-        )
-        values = [
-            ", ".join([item for item in sublist if len(item) > 0]) for sublist in values
-        ]
         values = ", ".join(values)
-        if primary_key_column is not None:
-            values += ", " + ", ".join(
-                ["@PK_" + x + "" + "=@PK_" + x + "" for x in alias_pk]
-            )
 
         # join components into final synax
-        statement = statement.format(
-            table=table_name,
-            declare=declare,
-            syntax=syntax,
-            pk=pk,
-            parameters=parameters,
-            values=values,
-        )
-
-        # create variables for execute method
-        args = list(
-            zip([x for x in column_names], [x for x in dtypes_sql], [x for x in size])
-        )
-        args = [item for sublist in args for item in sublist if item is not None]
+        statement = io.StringIO()
+        statement.write(_statement_start)
+        statement.write(declare)
+        statement.write(_statement_table)
+        statement.write(table)
+        statement.write(_statement_columns)
+        statement.write(syntax)
+        statement.write(_statement_pk)
+        statement.write(pk)
+        statement.write(_statement_parameters)
+        statement.write(parameters)
+        statement.write(_statement_values)
+        statement.write(values)
+        statement.write(_statement_end)
+        statement = statement.getvalue()
+
         if primary_key_column is not None:
             args += primary_key_column
 
@@ -216,3 +183,6 @@ class create:
         cursor = self._connection.cursor()
         cursor.execute(statement, args)
         cursor.commit()
+
+        # discard any schema read for a previous table with the same name
+        conversion.invalidate_schema(self._connection, table_name)
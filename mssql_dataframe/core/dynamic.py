@@ -1,25 +1,94 @@
 """Functions for handling strings that include SQL objects."""
 
 import re
+import warnings
+from functools import lru_cache
 from typing import Tuple, List
 
 import pyodbc
 
 from mssql_dataframe.core import custom_errors
 
+# maximum length of a sysname accepted by QUOTENAME
+quotename_length = 128
+
+# regular expressions compiled once for parsing object names, where statements, and column specifications
+schema_pattern = re.compile(r"\.+")
+combine_pattern = re.compile(r"\b(AND|OR)\b", flags=re.IGNORECASE)
+comparison_pattern = re.compile(
+    r"("
+    + "|".join(
+        [
+            ">=",
+            "<=",
+            "<>",
+            "!=",
+            "!>",
+            "!<",
+            "=",
+            ">",
+            "<",
+            "IS NULL",
+            "IS NOT NULL",
+        ]
+    )
+    + ")",
+    flags=re.IGNORECASE,
+)
+parentheses_pattern = re.compile(r"\(|\)")
+quotes_pattern = re.compile(r"^'|'$")
+size_pattern = re.compile(r"(\(\d+\)|\(\d.+\)|\(MAX\))")
+
+
+@lru_cache(maxsize=4096)
+def _quotename(name: str) -> str:
+    """Delimit a string the same as T-SQL QUOTENAME using the default brackets.
+
+    Parameters
+    ----------
+    name (str) : string to delimit
+
+    Returns
+    -------
+    safe (str) : delimited string, or None if the string is longer than a sysname
+    """
+    # sysname length is measured in UTF-16 code units
+    if len(name.encode("utf-16-le")) // 2 > quotename_length:
+        return None
+    safe = "[" + name.replace("]", "]]") + "]"
+
+    return safe
+
+
+def _deprecated_cursor(function: str):
+    """Warn that the cursor argument is no longer used.
+
+    Parameters
+    ----------
+    function (str) : name of the function the cursor was passed to
+    """
+    warnings.warn(
+        f"The cursor argument of {function} is deprecated and ignored, pass None instead.",
+        DeprecationWarning,
+        stacklevel=3,
+    )
+
 
 def escape(cursor: pyodbc.connect, inputs: List[str]) -> List[str]:
-    """Prepare dynamic strings by passing them through T-SQL QUOTENAME.
+    """Prepare dynamic strings by delimiting them the same as T-SQL QUOTENAME.
 
     Parameters
     ----------
-    cursor (pyodbc.connection.cursor) : cursor to execute statement
+    cursor (pyodbc.connection.cursor) : deprecated and ignored as strings are delimited locally, pass None
     inputs (list|str) : list of strings to add delimiter to make a valid SQL identifier
 
     Returns
     -------
     safe (list|str) : strings wrapped in SQL QUOTENAME
     """
+    if cursor is not None:
+        _deprecated_cursor("escape")
+
     # handle both flat strings collection like inputs
     flatten = False
     if isinstance(inputs, str):
@@ -30,20 +99,17 @@ def escape(cursor: pyodbc.connect, inputs: List[str]) -> List[str]:
 
     # handle schema dot (.) specification that can seperate strings that need to be escaped
     # flatten each list and combine with the char(255) for a unique delimiter
-    schema = [re.findall(r"\.+", x) for x in inputs]
+    schema = [schema_pattern.findall(x) for x in inputs]
     schema = [x + [chr(255)] for x in schema]
     schema = [item for sublist in schema for item in sublist]
-    inputs = [re.split(r"\.+", x) for x in inputs]
+    inputs = [schema_pattern.split(x) for x in inputs]
     inputs = [item for sublist in inputs for item in sublist]
 
-    # use QUOTENAME for each string
-    statement = "SELECT {syntax}"
-    syntax = ", ".join(["QUOTENAME(?)"] * len(inputs))
-    statement = statement.format(syntax=syntax)
-    cursor.execute(statement, *inputs)
-    safe = cursor.fetchone()
+    # delimit each string without a round trip to the server
+    safe = [_quotename(x) for x in inputs]
+
     # a string value is too long and returns None, so raise an exception
-    if [x for x in safe if x is None]:
+    if None in safe:
         raise custom_errors.SQLInvalidLengthObjectName("SQL object name is too long.")
 
     # reconstruct schema specification previously delimited by char(255)
@@ -63,7 +129,7 @@ def where(cursor: pyodbc.connect, where: str) -> Tuple[str, List[str]]:
 
     Parameters
     ----------
-    cursor (pyodbc.connection.cursor) : cursor to execute statement
+    cursor (pyodbc.connection.cursor) : deprecated and ignored as names are escaped locally, pass None
     where (str) : raw string to format
 
     Returns
@@ -71,70 +137,72 @@ def where(cursor: pyodbc.connect, where: str) -> Tuple[str, List[str]]:
     statement (str) : where statement containing parameters such as "...WHERE [username] = ?"
     args (list) : parameter values for where statement
     """
-    # regular expressions to parse where statement
-    combine = r"\bAND\b|\bOR\b"
-    comparison = [
-        ">=",
-        "<=",
-        "<>",
-        "!=",
-        "!>",
-        "!<",
-        "=",
-        ">",
-        "<",
-        "IS NULL",
-        "IS NOT NULL",
-    ]
-    comparison = r"(" + "|".join([x for x in comparison]) + ")"
-
-    # split on AND/OR
-    conditions = re.split(combine, where, flags=re.IGNORECASE)
-    conditions = [x.strip() for x in conditions]
-    # identify parentheses grouping and remove
-    group_start = [idx for idx, x in enumerate(conditions) if x.startswith("(")]
-    group_end = [idx for idx, x in enumerate(conditions) if x.endswith(")")]
-    conditions = [re.sub(r"\(|\)", "", x) for x in conditions]
-    # split on comparison operator
-    conditions = [re.split(comparison, x, flags=re.IGNORECASE) for x in conditions]
-    if len(conditions) == 1 and len(conditions[0]) == 1:
-        raise custom_errors.SQLInvalidSyntax("invalid syntax for where = " + where)
-    # form list of lists for each column, while handling IS NULL/IS NOT NULL split
-    conditions = [[y.strip() for y in x] for x in conditions]
-    conditions = [
-        [x[0], x[1::]] if len(x[2]) > 0 else [x[0], [x[1]]] for x in conditions
-    ]
+    if cursor is not None:
+        _deprecated_cursor("where")
+
+    # reuse the parsing of a previously seen where string
+    statement, args = _parse_where(where)
+
+    return statement, list(args)
+
+
+@lru_cache(maxsize=1024)
+def _parse_where(where: str) -> Tuple[str, Tuple[str]]:
+    """Parse a raw string into a where statement and its parameter values.
+
+    Parameters
+    ----------
+    where (str) : raw string to format
+
+    Returns
+    -------
+    statement (str) : where statement containing parameters such as "...WHERE [username] = ?"
+    args (tuple) : parameter values for where statement
+    """
+    # split on AND/OR, keeping each AND/OR to rejoin conditions
+    tokens = combine_pattern.split(where)
+    conditions = tokens[0::2]
+    recombine = tokens[1::2] + [""]
+
+    # split each condition on comparison operator, while identifying and removing parentheses grouping
+    column_names = []
+    parsed = []
+    for condition in conditions:
+        condition = condition.strip()
+        parts = comparison_pattern.split(parentheses_pattern.sub("", condition))
+        if len(parts) == 1:
+            raise custom_errors.SQLInvalidSyntax("invalid syntax for where = " + where)
+        parts = [x.strip() for x in parts]
+        column_names.append(parts[0])
+        parsed.append(
+            (condition.startswith("("), condition.endswith(")"), parts[1], parts[2])
+        )
+
     # santize column names
-    column_names = [x[0] for x in conditions]
-    column_names = escape(cursor, column_names)
-    conditions = [[x, conditions[idx][1]] for idx, x in enumerate(column_names)]
-
-    # form SQL where statement
-    statement = [
-        x[0] + " " + x[1][0] + " ?" if len(x[1]) > 1 else x[0] + " " + x[1][0]
-        for x in conditions
-    ]
-    # reintroduce grouping parentheses
-    statement = [
-        "(" + x if idx in group_start else x for idx, x in enumerate(statement)
-    ]
-    statement = [x + ")" if idx in group_end else x for idx, x in enumerate(statement)]
-    # rejoin on AND/OR
-    recombine = re.findall(combine, where, flags=re.IGNORECASE) + [""]
-    statement = list(zip(statement, recombine))
-    # finalize where string
-    statement = "WHERE " + " ".join([x[0] + " " + x[1] for x in statement])
+    column_names = escape(None, column_names)
+
+    # form SQL where statement and arguments, skipping arguments for IS NULL/IS NOT NULL
+    statement = []
+    args = []
+    for name, (group_start, group_end, operator, value), combine in zip(
+        column_names, parsed, recombine
+    ):
+        if value:
+            clause = f"{name} {operator} ?"
+            # remove single quotes that originate from statements such as WHERE 'ColumnA' IS NOT NULL
+            args.append(quotes_pattern.sub("", value))
+        else:
+            clause = f"{name} {operator}"
+        # reintroduce grouping parentheses
+        if group_start:
+            clause = "(" + clause
+        if group_end:
+            clause = clause + ")"
+        statement += [clause, combine]
+    statement = "WHERE " + " ".join(statement)
     statement = statement.strip()
 
-    # form arguments, skipping IS NULL/IS NOT NULL
-    args = {
-        "param" + str(idx): x[1][1] for idx, x in enumerate(conditions) if len(x[1]) > 1
-    }
-    args = [x[1][1] for x in conditions if len(x[1]) > 1]
-    # remove single quotes that originate from statements such as WHERE 'ColumnA' IS NOT NULL
-    args = [re.sub(r"^'|'$", "", x) for x in args]
-
-    return statement, args
+    return statement, tuple(args)
 
 
 def column_spec(columns: List[str]) -> List[str]:
@@ -154,10 +222,9 @@ def column_spec(columns: List[str]) -> List[str]:
         columns = [columns]
         flatten = True
 
-    pattern = r"(\(\d+\)|\(\d.+\)|\(MAX\))"
-    size = [re.findall(pattern, x) for x in columns]
+    size = [size_pattern.findall(x) for x in columns]
     size = [x[0] if len(x) > 0 else None for x in size]
-    dtypes_sql = [re.sub(pattern, "", var) for var in columns]
+    dtypes_sql = [size_pattern.sub("", var) for var in columns]
 
     if flatten:
         size = size[0]
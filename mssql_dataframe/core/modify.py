@@ -3,7 +3,7 @@
 from typing import Literal, List
 import pyodbc
 
-from mssql_dataframe.core import dynamic
+from mssql_dataframe.core import dynamic, conversion
 
 
 class modify:
@@ -135,6 +135,9 @@ class modify:
         cursor = self._connection.cursor()
         cursor.execute(statement, *args)
 
+        # schema changed so it needs to be read again
+        conversion.invalidate_schema(self._connection, table_name)
+
     def primary_key(
         self,
         table_name: str,
@@ -188,26 +191,20 @@ class modify:
         args = [table_name, primary_key_name]
         if modify == "add":
             args += columns
-            declare = "\n".join(
-                [
-                    "DECLARE @PK" + str(idx) + " SYSNAME = ?;"
-                    for idx, _ in enumerate(columns)
-                ]
-            )
+            declare = []
+            keys = []
+            parameter = []
+            value = []
+            for idx in range(len(columns)):
+                declare.append(f"DECLARE @PK{idx} SYSNAME = ?;")
+                keys.append(f"QUOTENAME(@PK{idx})")
+                parameter.append(f", @PK{idx} SYSNAME")
+                value.append(f", @PK{idx}=@PK{idx}")
+            declare = "\n".join(declare)
             syntax = "'ADD CONSTRAINT '"
-            keys = "+','+".join(
-                ["QUOTENAME(@PK" + str(idx) + ")" for idx, _ in enumerate(columns)]
-            )
-            keys = "+'PRIMARY KEY ('+" + keys + "+')'"
-            parameter = " ".join(
-                [", @PK" + str(idx) + " SYSNAME" for idx, _ in enumerate(columns)]
-            )
-            value = " ".join(
-                [
-                    ", @PK" + str(idx) + "=@PK" + str(idx)
-                    for idx, _ in enumerate(columns)
-                ]
-            )
+            keys = "+'PRIMARY KEY ('+" + "+','+".join(keys) + "+')'"
+            parameter = " ".join(parameter)
+            value = " ".join(value)
         elif modify == "drop":
             declare = ""
             syntax = "'DROP CONSTRAINT '"
@@ -223,3 +220,6 @@ class modify:
 
         cursor = self._connection.cursor()
         cursor.execute(statement, *args)
+
+        # schema changed so it needs to be read again
+        conversion.invalidate_schema(self._connection, table_name)
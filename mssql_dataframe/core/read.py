@@ -1,12 +1,15 @@
 """Methods for reading from SQL into a dataframe."""
 
-from typing import Literal
+from typing import Callable, List, Literal, Tuple
 
 import pandas as pd
 import pyodbc
 
 from mssql_dataframe.core import custom_errors, dynamic, conversion
 
+# allowed values for order_direction
+order_options = (None, "ASC", "DESC")
+
 
 class read:
     """Class for reading from SQL into a dataframe."""
@@ -28,6 +31,7 @@ class read:
         limit: int = None,
         order_column: str = None,
         order_direction: Literal[None, "ASC", "DESC"] = None,
+        schema: pd.DataFrame = None,
     ) -> pd.DataFrame:
         """Select data from SQL into a dataframe.
 
@@ -39,6 +43,7 @@ class read:
         limit (int, default=None) : select limited number of records only
         order_column (str, default=None) : order results by column
         order_direction (str, default=None) : order direction
+        schema (pandas.DataFrame, default=None) : output of conversion.get_schema for the table, if None it is read from SQL
 
         Returns
         -------
@@ -71,8 +76,119 @@ class read:
         Select using conditions grouped by parentheses while applying a limit and order.
         >>> query = read.table('##ExampleRead', where="(ColumnA>5 AND ColumnB IS NOT NULL) OR ColumnC IS NULL", limit=5, order_column='ColumnB', order_direction='DESC')
         """
-        # get table schema for conversion to pandas
-        schema, _ = conversion.get_schema(self._connection, table_name)
+        # develop statement, escaping object names and validating options
+        statement, schema, args = self._statement(
+            table_name,
+            column_names,
+            where,
+            limit,
+            order_column,
+            order_direction,
+            schema,
+        )
+
+        # read sql query
+        dataframe = conversion.read_values(
+            statement, schema, self._connection, args or None
+        )
+
+        return dataframe
+
+    def compile_table(
+        self,
+        table_name: str,
+        column_names: list = None,
+        where: str = None,
+        limit: int = None,
+        order_column: str = None,
+        order_direction: Literal[None, "ASC", "DESC"] = None,
+        schema: pd.DataFrame = None,
+    ) -> Callable[[list], pd.DataFrame]:
+        """Prepare a select once for repeatedly reading data from SQL into a dataframe.
+
+        The schema, escaped object names, and statement are determined a single time so each call
+        only executes the statement. Parameters are the same as the table method.
+
+        Parameters
+        ----------
+        table_name (str) : name of table to select data frame
+        column_names (list|str, default=None) : list of columns to select, or None to select all
+        where (str, default=None) : where clause filter to apply
+        limit (int, default=None) : select limited number of records only
+        order_column (str, default=None) : order results by column
+        order_direction (str, default=None) : order direction
+        schema (pandas.DataFrame, default=None) : output of conversion.get_schema for the table, if None it is read from SQL
+
+        Returns
+        -------
+        select (Callable) : function that accepts an optional list of new values for the limit and where
+        parameters, in the order they appear in the statement, and returns a dataframe
+
+        Examples
+        --------
+        A sample table to read.
+        >>> create.table('##ExampleCompileRead', {'ColumnA': 'TINYINT', 'PK': 'INT'}, primary_key_column='PK')
+        >>> df = insert('##ExampleCompileRead', pd.DataFrame({'ColumnA': [5, 6, 7]}, index=pd.Index([0, 1, 2], name='PK')))
+
+        Prepare to select the rows where ColumnA is greater than a value.
+        >>> select = read.compile_table('##ExampleCompileRead', where="ColumnA>5")
+
+        Select using the value in the where parameter, then using a different value.
+        >>> df = select()
+        >>> df = select([7])
+        """
+        statement, schema, args = self._statement(
+            table_name,
+            column_names,
+            where,
+            limit,
+            order_column,
+            order_direction,
+            schema,
+        )
+        connection = self._connection
+
+        # only execute the statement when called, optionally with new parameter values
+        def select(values: list = None) -> pd.DataFrame:
+            if values is None:
+                values = args
+            elif len(values) != len(args):
+                raise ValueError(f"{len(args)} parameter values are required")
+            return conversion.read_values(statement, schema, connection, values or None)
+
+        return select
+
+    def _statement(
+        self,
+        table_name: str,
+        column_names: list,
+        where: str,
+        limit: int,
+        order_column: str,
+        order_direction: str,
+        schema: pd.DataFrame,
+    ) -> Tuple[str, pd.DataFrame, List]:
+        """Develop a select statement and its parameter values.
+
+        Parameters
+        ----------
+        table_name (str) : name of table to select data frame
+        column_names (list|str) : list of columns to select, or None to select all
+        where (str) : where clause filter to apply
+        limit (int) : select limited number of records only
+        order_column (str) : order results by column
+        order_direction (str) : order direction
+        schema (pandas.DataFrame) : output of conversion.get_schema for the table, if None it is read from SQL
+
+        Returns
+        -------
+        statement (str) : select statement with escaped object names
+        schema (pandas.DataFrame) : table column specifications and conversion rules
+        args (list) : values for the limit and where parameters
+        """
+        # get table schema for conversion to pandas, unless already known by the caller
+        if schema is None:
+            schema, _ = conversion.get_schema(self._connection, table_name)
 
         # always read in primary key columns for dataframe index
         primary_key_columns = list(
@@ -82,7 +198,7 @@ class read:
         )
 
         # dynamic table and column names, and column_name development
-        table_name = dynamic.escape(self._connection.cursor(), table_name)
+        table_name = dynamic.escape(None, table_name)
         if column_names is None:
             column_names = "*"
         else:
@@ -90,52 +206,49 @@ class read:
                 column_names = [column_names]
             elif isinstance(column_names, pd.Index):
                 column_names = list(column_names)
-            column_names = primary_key_columns + column_names
-            column_names = list(set(column_names))
+            # remove duplicates while keeping primary keys first in a stable order
+            column_names = list(dict.fromkeys(primary_key_columns + column_names))
             missing = [x for x in column_names if x not in schema.index]
             if len(missing) > 0:
                 raise custom_errors.SQLColumnDoesNotExist(
                     f"Column does not exist in table {table_name}:", missing
                 )
-            column_names = dynamic.escape(self._connection.cursor(), column_names)
+            column_names = dynamic.escape(None, column_names)
             column_names = "\n,".join(column_names)
 
-        # format optional where_statement
-        if where is None:
-            where_statement, where_args = ("", None)
-        else:
-            where_statement, where_args = dynamic.where(
-                self._connection.cursor(), where
-            )
-
-        # format optional limit
+        # format optional limit as a parameter so the statement text depends only on its shape
+        args = []
         if limit is None:
             limit = ""
         elif not isinstance(limit, int):
             raise ValueError("limit must be an integer")
         else:
-            limit = "TOP(" + str(limit) + ")"
+            args.append(limit)
+            limit = "TOP(?)"
+
+        # format optional where_statement
+        if where is None:
+            where_statement = ""
+        else:
+            where_statement, where_args = dynamic.where(None, where)
+            args.extend(where_args)
 
         # format optional order
-        options = [None, "ASC", "DESC"]
-        if (order_column is None and order_direction is not None) or (
-            order_column is not None and order_direction is None
-        ):
+        if (order_column is None) != (order_direction is None):
             raise ValueError("order_column and order_direction must both be specified")
-        elif order_direction not in options:
-            raise ValueError("order direction must be one of: " + str(options))
+        elif order_direction not in order_options:
+            raise ValueError(
+                "order direction must be one of: " + str(list(order_options))
+            )
         elif order_column is not None:
             order = (
-                "ORDER BY "
-                + dynamic.escape(self._connection.cursor(), order_column)
-                + " "
-                + order_direction
+                "ORDER BY " + dynamic.escape(None, order_column) + " " + order_direction
             )
         else:
             order = ""
 
         # skip security check since table_name, column_names, where_statement, order have been escaped
-        # limit has been enforced to be an integer
+        # limit and where values are passed as parameters
         statement = f"""
         SELECT {limit}
             {column_names}
@@ -145,9 +258,4 @@ class read:
             {order}
         """  # nosec hardcoded_sql_expressions
 
-        # read sql query
-        dataframe = conversion.read_values(
-            statement, schema, self._connection, where_args
-        )
-
-        return dataframe
+        return statement, schema, args
@@ -1,15 +1,19 @@
 """Methods for inserting data into SQL."""
 
 from typing import Tuple, List
+import logging
 import string
 import random
 
+import numpy as np
 import pandas as pd
 import pyodbc
 
-from mssql_dataframe.core import custom_errors, conversion, modify, create
+from mssql_dataframe.core import custom_errors, conversion, dynamic, modify, create
 from mssql_dataframe.core.write import _exceptions
 
+logger = logging.getLogger(__name__)
+
 
 class insert:
     """Class for inserting data into SQL."""
@@ -154,28 +158,29 @@ class insert:
         ]
         dtypes = dtypes.astype("string")
 
-        # add byte size for string columns
-        idx = dtypes[dtypes["sql_category"] == "character string"].index
-        dtypes.loc[idx, "sql_type"] = (
-            dtypes.loc[idx, "sql_type"] + "(" + dtypes.loc[idx, "column_size"] + ")"
-        )
-
-        # add precision and scale for exact decimal numerics
-        idx = dtypes[dtypes["sql_category"] == "exact_decimal_numeric"].index
-        dtypes.loc[idx, "sql_type"] = (
-            dtypes.loc[idx, "sql_type"]
-            + "("
-            + dtypes.loc[idx, "column_size"]
-            + ","
-            + dtypes.loc[idx, "decimal_digits"]
-            + ")"
-        )
-
-        # add byte size for binary columns
-        idx = dtypes[dtypes["sql_category"] == "binary"].index
-        dtypes.loc[idx, "sql_type"] = (
-            dtypes.loc[idx, "sql_type"] + "(" + dtypes.loc[idx, "column_size"] + ")"
+        # add byte size for string and binary columns, precision and scale for exact decimal numerics
+        category = dtypes["sql_category"]
+        sql_type = np.select(
+            [
+                category.isin(["character string", "binary"]).to_numpy(
+                    dtype=bool, na_value=False
+                ),
+                (category == "exact_decimal_numeric").to_numpy(
+                    dtype=bool, na_value=False
+                ),
+            ],
+            [
+                dtypes["sql_type"] + "(" + dtypes["column_size"] + ")",
+                dtypes["sql_type"]
+                + "("
+                + dtypes["column_size"]
+                + ","
+                + dtypes["decimal_digits"]
+                + ")",
+            ],
+            default=dtypes["sql_type"],
         )
+        dtypes["sql_type"] = pd.Series(sql_type, index=dtypes.index, dtype="string")
 
         # avoid creating an int identify data type column for a source table
         dtypes["sql_type"] = dtypes["sql_type"].replace("int identity", "int")
@@ -243,8 +248,6 @@ class insert:
 
         # insert data into source temporary table
         uid = "".join(random.choices(string.ascii_lowercase, k=4))  # nosec B311
-        temp_name_upt =  table_name.replace(".", "_")
-        ##temp_name = f"_source_{temp_name_upt}_{uid}"
         temp_name = f"_source_temp_name_upt_{uid}"
         columns = list(dataframe.columns)
         if any(dataframe.index.names):
@@ -252,14 +255,21 @@ class insert:
 
         dtypes = self._column_spec(schema, columns)
 
-        not_nullable = list(schema[~schema["is_nullable"]].index)
+        not_nullable = schema.index[~schema["is_nullable"].to_numpy()].tolist()
 
-        print(f'The insert temp name {temp_name}')
         self._create.table(
             temp_name, dtypes, not_nullable, primary_key_column=match_columns
         )
 
-        dataframe = self.insert(temp_name, dataframe, include_metadata_timestamps=False)
+        # remove the source table if it cannot be loaded
+        try:
+            dataframe = self.insert(
+                temp_name, dataframe, include_metadata_timestamps=False
+            )
+        except Exception:
+            cursor.rollback()
+            self._drop_source(cursor, temp_name, failure=True)
+            raise
 
         # reset match columns that were part of the primary key in the source table
         # dataframe needs returned in the event values were adjusted but indicies/columns should be the same
@@ -269,3 +279,26 @@ class insert:
             dataframe = dataframe.reset_index(level=extra)
 
         return schema, dataframe, match_columns, temp_name
+
+    def _drop_source(
+        self, cursor: pyodbc.connect, temp_name: str, failure: bool = False
+    ):
+        """Drop the source table created for update and merge operations.
+
+        Parameters
+        ----------
+        cursor (pyodbc.connection.cursor) : cursor to execute statement
+        temp_name (str) : name of the source temporary table to drop
+        failure (bool, default=False) : if the operation using the source table already failed, log an error dropping the table instead of raising it
+        """
+        try:
+            cursor.execute("DROP TABLE " + dynamic.escape(None, temp_name))
+            cursor.commit()
+        except pyodbc.Error as err:
+            # keep the exception of the failed operation instead of replacing it
+            if not failure:
+                raise
+            logger.warning(f"Unable to drop source table {temp_name}: {err}")
+        finally:
+            # discard the schema read while inserting into the dropped source table
+            conversion.invalidate_schema(self._connection, temp_name)
@@ -4,7 +4,6 @@ from typing import List, Tuple
 
 import pandas as pd
 
-from mssql_dataframe.core import dynamic
 from mssql_dataframe.core.write.insert import insert
 
 
@@ -235,11 +234,14 @@ class merge(insert):
                 + insert_columns
                 + delete_requires
             )
-        print (f'Merge statement {statement}')
         # execute statement to perform update in target table using source
-        cursor.execute(statement, args)
-        temp_name = dynamic.escape(cursor, temp_name)
-        cursor.execute("DROP TABLE " + temp_name)
-        cursor.commit()
+        # always dropping the source table, even if the statement fails
+        try:
+            cursor.execute(statement, args)
+        except Exception:
+            cursor.rollback()
+            self._drop_source(cursor, temp_name, failure=True)
+            raise
+        self._drop_source(cursor, temp_name)
 
         return dataframe
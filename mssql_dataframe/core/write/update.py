@@ -4,7 +4,6 @@ from typing import List, Tuple
 
 import pandas as pd
 
-from mssql_dataframe.core import dynamic
 from mssql_dataframe.core.write.insert import insert
 
 
@@ -155,9 +154,13 @@ class update(insert):
         args = [table_name, temp_name] + match_columns + update_columns
 
         # execute statement to perform update in target table using source
-        cursor.execute(statement, args)
-        temp_name = dynamic.escape(cursor, temp_name)
-        cursor.execute("DROP TABLE " + temp_name)
-        cursor.commit()
+        # always dropping the source table, even if the statement fails
+        try:
+            cursor.execute(statement, args)
+        except Exception:
+            cursor.rollback()
+            self._drop_source(cursor, temp_name, failure=True)
+            raise
+        self._drop_source(cursor, temp_name)
 
         return dataframe
@@ -1,6 +1,7 @@
 """Methods for creating, modifying, reading, and writing between dataframes and SQL."""
 
 from importlib.metadata import version
+from functools import lru_cache
 import sys
 import logging
 
@@ -17,6 +18,12 @@ from mssql_dataframe.core.write.write import write
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _package_version(name: str) -> str:
+    """Installed package version, cached as it cannot change within a process."""
+    return version(name)
+
+
 class SQLServer(connect):
     """Class containing methods for creating, modifying, reading, and writing between dataframes and SQL Server.
 
@@ -41,6 +48,7 @@ class SQLServer(connect):
     modify : methods for modifying tables columns and primary keys
     read : methods for reading from SQL tables
     write : methods for inserting, updating, and merging records
+    version_spec : versions of Python, SQL, and required packages, with the SQL version None unless debug logging is enabled
 
     Examples
     --------
@@ -83,19 +91,24 @@ class SQLServer(connect):
             logger.warning(msg)
 
     def log_init(self):
-        """Log connection info and versions for Python, SQL, and required packages."""
+        """Log connection info and versions for Python, SQL, and required packages.
+
+        The SQL version is only queried if debug logging is enabled, otherwise version_spec["sql"] is None.
+        """
         # determine versions for debugging
         self.version_spec = {}
         # Python
         self.version_spec["python"] = sys.version_info
-        # SQL
-        cur = self.connection.cursor()
-        name = cur.execute("SELECT @@VERSION").fetchone()
-        self.version_spec["sql"] = name[0]
+        # SQL, skipping the query when it would not be logged
+        self.version_spec["sql"] = None
+        if logger.isEnabledFor(logging.DEBUG):
+            cur = self.connection.cursor()
+            name = cur.execute("SELECT @@VERSION").fetchone()
+            self.version_spec["sql"] = name[0]
         # packages
         names = ["mssql-dataframe", "pyodbc", "pandas"]
         for name in names:
-            self.version_spec[name] = version(name)
+            self.version_spec[name] = _package_version(name)
 
         # output actual connection info (possibly derived within connection object)
         # logger.debug(f"Connection Info: {self.connection_spec}")
@@ -116,3 +129,19 @@ class SQLServer(connect):
         schema, _ = conversion.get_schema(self.connection, table_name)
 
         return schema
+
+    def invalidate_schema(self, table_name: str):
+        """Discard the cached schema of an SQL table so it is read again on next use.
+
+        Schemas are cached for a short time to avoid repeated queries. Use this after
+        changing a table outside of mssql_dataframe, such as with an ALTER TABLE statement.
+
+        Parameters
+        ----------
+        table_name (str) : table name to discard the schema for
+
+        Returns
+        -------
+        None
+        """
+        conversion.invalidate_schema(self.connection, table_name)
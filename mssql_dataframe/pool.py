@@ -0,0 +1,103 @@
+"""Class for reading from SQL concurrently using a pool of database connections."""
+
+from concurrent.futures import ThreadPoolExecutor
+from queue import Queue
+from typing import List
+
+import pandas as pd
+
+from mssql_dataframe.connect import connect
+from mssql_dataframe.core import conversion, read
+
+
+class pool:
+    r"""Pool of connections for performing independent reads in parallel.
+
+    kwargs are passed to connect for establishing each connection. pyodbc connections shouldn't be
+    shared between threads, so each read uses a connection that is not in use by another thread.
+    pyodbc releases the GIL while executing statements and fetching rows.
+
+    Parameters
+    ----------
+    size (int, default=4) : number of connections, which is also the maximum number of concurrent reads
+    keyword database (str) : name of database to connect to
+    keyword server (str) : name of server to connect to
+
+    Properties
+    ----------
+    connections (queue.Queue) : connections that are not currently in use
+
+    Examples
+    --------
+    Sample tables to read, committed by another connection.
+    >>> create.table('##ExamplePoolA', {'ColumnA': 'TINYINT'})
+    >>> create.table('##ExamplePoolB', {'ColumnB': 'VARCHAR(1)'})
+
+    Read both tables at the same time, one as the entire table and the other using read.table keyword arguments.
+    >>> import env
+    >>> connections = pool(size=2, server=env.server, database=env.database)
+    >>> result = connections.read_many(['##ExamplePoolA', {'table_name': '##ExamplePoolB', 'limit': 1}])
+    >>> connections.close()
+    """
+
+    def __init__(self, size: int = 4, **kwargs):
+        if not isinstance(size, int) or size < 1:
+            raise ValueError("size must be a positive integer")
+
+        self.size = size
+        self.connections = Queue()
+        for _ in range(size):
+            try:
+                connection = connect(**kwargs).connection
+            except Exception:
+                # release connections already established before raising
+                self.close()
+                raise
+            self.connections.put(connection)
+
+    def read_many(self, queries: List[dict]) -> List[pd.DataFrame]:
+        """Select data from multiple SQL tables concurrently.
+
+        Parameters
+        ----------
+        queries (list) : table names or dictionaries of keyword arguments for read.table
+
+        Returns
+        -------
+        result (list) : dataframe from each query, in the same order as queries
+        """
+        queries = [
+            {"table_name": query} if isinstance(query, str) else query
+            for query in queries
+        ]
+
+        with ThreadPoolExecutor(max_workers=self.size) as executor:
+            result = list(executor.map(self._read, queries))
+
+        return result
+
+    def close(self):
+        """Close all connections in the pool."""
+        while not self.connections.empty():
+            connection = self.connections.get()
+            conversion.invalidate_schema(connection)
+            connection.close()
+
+    def _read(self, query: dict) -> pd.DataFrame:
+        """Select data using a connection that isn't in use by another thread.
+
+        Parameters
+        ----------
+        query (dict) : keyword arguments for read.table
+
+        Returns
+        -------
+        dataframe (pandas.DataFrame): tabular data from select statement
+        """
+        connection = self.connections.get()
+        try:
+            dataframe = read.read(connection).table(**query)
+        finally:
+            self.connections.put(connection)
+
+        return dataframe
@@ -1,4 +1,5 @@
 import env
+from concurrent.futures import ThreadPoolExecutor
 
 import pandas as pd
 
@@ -57,3 +58,111 @@ def test_read_values_errors(sql):
             schema=schema,
             connection=sql,
         )
+
+
+def test_format_values():
+    # DATETIME is bound with 3 decimal places and TIME omits a zero fraction
+    _, values = conversion.prepare_values(
+        pd.DataFrame({"sql_type": ["datetime", "time"]}, index=["ColumnA", "ColumnB"]),
+        pd.DataFrame(
+            {
+                "ColumnA": pd.Series(
+                    [
+                        pd.Timestamp("2021-01-01 00:00:00.003"),
+                        pd.Timestamp("2021-01-01"),
+                    ],
+                    dtype="datetime64[ns]",
+                ),
+                "ColumnB": pd.Series(
+                    [pd.Timedelta(0), pd.Timedelta(milliseconds=3)],
+                    dtype="timedelta64[ns]",
+                ),
+            }
+        ),
+    )
+    assert values == [
+        ["2021-01-01 00:00:00.003", "00:00:00"],
+        ["2021-01-01 00:00:00.000", "00:00:00.003000"],
+    ]
+
+
+def test_get_schema_cached(sql):
+    schema, _ = conversion.get_schema(
+        connection=sql, table_name="##test_conversion_error"
+    )
+
+    # cached schema is returned as a copy
+    schema.loc["id", "sql_type"] = "changed"
+    cached, _ = conversion.get_schema(
+        connection=sql, table_name="##test_conversion_error"
+    )
+    assert cached.at["id", "sql_type"] == "bigint"
+
+
+def test_invalidate_schema(sql):
+    table_name = "##test_conversion_invalidate"
+    cursor = sql.cursor()
+    cursor.execute(f"CREATE TABLE {table_name} (id INT)")
+    cursor.commit()
+    conversion.get_schema(connection=sql, table_name=table_name)
+
+    # schema is reused after the table changes until invalidated
+    cursor.execute(f"ALTER TABLE {table_name} ADD ColumnB INT")
+    cursor.commit()
+    schema, _ = conversion.get_schema(connection=sql, table_name=table_name)
+    assert "ColumnB" not in schema.index
+
+    # a different spelling of the table name also invalidates the schema
+    conversion.invalidate_schema(sql, "dbo." + table_name.upper())
+    schema, _ = conversion.get_schema(connection=sql, table_name=table_name)
+    assert "ColumnB" in schema.index
+
+
+def test_schema_cache_eviction(sql, monkeypatch):
+    monkeypatch.setattr(conversion, "schema_cache_size", 1)
+    table_name = "##test_conversion_eviction"
+    cursor = sql.cursor()
+    cursor.execute(f"CREATE TABLE {table_name} (id INT)")
+    cursor.commit()
+    conversion.get_schema(connection=sql, table_name=table_name)
+    cursor.execute(f"ALTER TABLE {table_name} ADD ColumnB INT")
+    cursor.commit()
+
+    # reading another table evicts the oldest schema once the cache is full
+    conversion.get_schema(connection=sql, table_name="##test_conversion_error")
+    schema, _ = conversion.get_schema(connection=sql, table_name=table_name)
+    assert "ColumnB" in schema.index
+
+
+def test_schema_cache_closed(sql, monkeypatch):
+    db = connect(database=env.database, server=env.server, trusted_connection="yes")
+    cursor = db.connection.cursor()
+    cursor.execute("CREATE TABLE ##test_conversion_closed (id INT)")
+    cursor.commit()
+    conversion.get_schema(
+        connection=db.connection, table_name="##test_conversion_closed"
+    )
+    db.connection.close()
+
+    # closed connections are released when another schema is cached once the cache is full
+    monkeypatch.setattr(conversion, "schema_cache_size", 1)
+    conversion.invalidate_schema(sql, "##test_conversion_error")
+    conversion.get_schema(connection=sql, table_name="##test_conversion_error")
+    assert id(db.connection) not in conversion._schema_cache
+
+
+def test_schema_cache_threads(sql, monkeypatch):
+    monkeypatch.setattr(conversion, "schema_cache_size", 2)
+    schema, _ = conversion.get_schema(
+        connection=sql, table_name="##test_conversion_error"
+    )
+
+    # concurrent stores, evictions, and invalidations such as from pool.read_many
+    def worker(idx):
+        table_name = f"##test_conversion_thread_{idx % 5}"
+        conversion._cache_schema(sql, table_name, ("tempdb", table_name, "dbo", schema))
+        conversion.invalidate_schema(sql, table_name)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(worker, range(1000)))
+    assert sum(len(x[1]) for x in conversion._schema_cache.values()) <= 2
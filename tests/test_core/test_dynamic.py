@@ -29,38 +29,71 @@ def test_escape(cursor):
         "abc[]def",
         "user's custom name",
     ]
-    clean = dynamic.escape(cursor, inputs)
+    clean = dynamic.escape(None, inputs)
     assert isinstance(inputs, list)
     assert len(clean) == len(inputs)
 
     # single string
     inputs = "SingleString"
-    clean = dynamic.escape(cursor, inputs)
+    clean = dynamic.escape(None, inputs)
     assert isinstance(inputs, str)
 
     # dataframe columns (pandas index)
     dataframe = pd.DataFrame(columns=["A", "B"])
-    clean = dynamic.escape(cursor, dataframe.columns)
+    clean = dynamic.escape(None, dataframe.columns)
     assert len(clean) == dataframe.shape[1]
 
     # schema specification list
     inputs = ["test.dbo.table", "tempdb..##table"]
-    clean = dynamic.escape(cursor, inputs)
+    clean = dynamic.escape(None, inputs)
     assert len(clean) == len(inputs)
 
     # schema specification single string
     inputs = "test.dbo.table"
-    clean = dynamic.escape(cursor, inputs)
+    clean = dynamic.escape(None, inputs)
     assert isinstance(clean, str)
 
-    # value that is too long
+    # value that is too long, which QUOTENAME returns as NULL
     with pytest.raises(custom_errors.SQLInvalidLengthObjectName):
-        dynamic.escape(cursor, inputs="a" * 1000)
+        dynamic.escape(None, inputs="a" * 1000)
+    assert cursor.execute("SELECT QUOTENAME(?)", "a" * 1000).fetchone()[0] is None
+
+
+def test_escape_repeated(cursor):
+    # repeated strings and schema specifications give the same result as T-SQL QUOTENAME
+    inputs = ["RepeatedTable", "Repeated]Column", "RepeatedTable"]
+    expected = [cursor.execute("SELECT QUOTENAME(?)", x).fetchone()[0] for x in inputs]
+    assert dynamic.escape(None, inputs) == expected
+    # repeated strings reuse the previous result
+    hits = dynamic._quotename.cache_info().hits
+    assert dynamic.escape(None, inputs) == expected
+    assert dynamic._quotename.cache_info().hits >= hits + len(inputs)
+    expected = cursor.execute(
+        "SELECT QUOTENAME(?) + '.' + QUOTENAME(?)", "dbo", "RepeatedTable"
+    ).fetchone()[0]
+    assert dynamic.escape(None, "dbo.RepeatedTable") == expected
+
+
+def test_cursor_deprecated(cursor):
+    # the cursor argument is ignored but still accepted
+    with pytest.warns(DeprecationWarning):
+        assert dynamic.escape(cursor, "ColumnA") == "[ColumnA]"
+    with pytest.warns(DeprecationWarning):
+        where_statement, _ = dynamic.where(cursor, "ColumnA = 1")
+    assert where_statement == "WHERE [ColumnA] = ?"
+
+
+def test_escape_matches_quotename(cursor):
+    # local delimiting gives the same result as T-SQL QUOTENAME
+    inputs = ["a]b", "a[b]]c", "user's name", "\u00e9\u00e8", "a" * 128]
+    for value in inputs:
+        expected = cursor.execute("SELECT QUOTENAME(?)", value).fetchone()[0]
+        assert dynamic.escape(None, value) == expected
 
 
 def test_where(cursor):
     where = "ColumnA >5 AND ColumnB=2 and ColumnANDC IS NOT NULL"
-    where_statement, where_args = dynamic.where(cursor, where)
+    where_statement, where_args = dynamic.where(None, where)
     assert (
         where_statement
         == "WHERE [ColumnA] > ? AND [ColumnB] = ? and [ColumnANDC] IS NOT NULL"
@@ -68,7 +101,7 @@ def test_where(cursor):
     assert where_args == ["5", "2"]
 
     where = "ColumnA <>5 AND ColumnB!=2 and ColumnANDC IS NOT NULL"
-    where_statement, where_args = dynamic.where(cursor, where)
+    where_statement, where_args = dynamic.where(None, where)
     assert (
         where_statement
         == "WHERE [ColumnA] <> ? AND [ColumnB] != ? and [ColumnANDC] IS NOT NULL"
@@ -76,7 +109,7 @@ def test_where(cursor):
     assert where_args == ["5", "2"]
 
     where = "ColumnB>4 AND ColumnC IS NOT NULL OR ColumnD IS NULL"
-    where_statement, where_args = dynamic.where(cursor, where)
+    where_statement, where_args = dynamic.where(None, where)
     assert (
         where_statement
         == "WHERE [ColumnB] > ? AND [ColumnC] IS NOT NULL OR [ColumnD] IS NULL"
@@ -84,10 +117,20 @@ def test_where(cursor):
     assert where_args == ["4"]
 
     where = "ColumnA IS NULL OR ColumnA != 'CLOSED'"
-    where_statement, where_args = dynamic.where(cursor, where)
+    where_statement, where_args = dynamic.where(None, where)
     assert where_statement == "WHERE [ColumnA] IS NULL OR [ColumnA] != ?"
     assert where_args == ["CLOSED"]
 
     conditions = "no operator present"
     with pytest.raises(custom_errors.SQLInvalidSyntax):
-        dynamic.where(cursor, conditions)
+        dynamic.where(None, conditions)
+
+
+def test_where_cached(cursor):
+    # repeated where strings reuse their parsing without sharing argument lists
+    where = "CachedColumn = 1"
+    _, where_args = dynamic.where(None, where)
+    where_args.append("2")
+    where_statement, where_args = dynamic.where(None, where)
+    assert where_statement == "WHERE [CachedColumn] = ?"
+    assert where_args == ["1"]
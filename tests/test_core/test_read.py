@@ -5,7 +5,7 @@ import pandas as pd
 
 
 from mssql_dataframe.connect import connect
-from mssql_dataframe.core import custom_errors, create, read
+from mssql_dataframe.core import custom_errors, conversion, create, read
 from mssql_dataframe.core.write import insert
 from mssql_dataframe.__equality__ import compare_dfs
 
@@ -104,11 +104,56 @@ def test_undefined_conversion(sql):
         sql.read.table(table_name)
 
 
+def test_timestamp_out_of_range(sql):
+    table_name = "##test_timestamp_out_of_range"
+    columns = {"ColumnA": "DATETIME2", "ColumnB": "DATETIME2"}
+    sql.create.table(table_name, columns)
+
+    # boundary values of DATETIME2 are outside of the pandas Timestamp range
+    cursor = sql.connection.cursor()
+    cursor.execute(
+        f"INSERT INTO {table_name} VALUES('2021-06-22', '0001-01-01'), ('2021-06-22', '9999-12-31 23:59:59.9999999')"
+    )
+    cursor.commit()
+
+    with pytest.raises(ValueError, match="column ColumnB"):
+        sql.read.table(table_name)
+
+    # the column within range can still be read
+    dataframe = sql.read.table(table_name, column_names="ColumnA")
+    assert (dataframe["ColumnA"] == pd.Timestamp("2021-06-22")).all()
+
+
 def test_select_all(sql, sample):
     dataframe = sql.read.table(table_name)
     assert compare_dfs(dataframe, sample)
 
 
+def test_select_schema(sql, sample):
+    # reuse a schema that was previously read for the table
+    schema, _ = conversion.get_schema(sql.connection, table_name)
+    dataframe = sql.read.table(table_name, schema=schema)
+    assert compare_dfs(dataframe, sample)
+
+
+def test_compile_table(sql, sample):
+    select = sql.read.compile_table(table_name, where="ColumnB>5", limit=5)
+
+    # compiled parameter values
+    dataframe = select()
+    assert compare_dfs(dataframe, sample[(sample["ColumnB"] > 5).fillna(False)])
+
+    # new parameter values for the limit and where
+    dataframe = select([5, 4])
+    assert compare_dfs(dataframe, sample[(sample["ColumnB"] > 4).fillna(False)])
+    dataframe = select([1, 4])
+    assert len(dataframe) == 1
+
+    # incorrect number of parameter values
+    with pytest.raises(ValueError):
+        select([1])
+
+
 def test_select_columns(sql, sample):
     column_names = sample.columns.drop("ColumnB")
     dataframe = sql.read.table(table_name, column_names)
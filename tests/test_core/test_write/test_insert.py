@@ -3,6 +3,7 @@ import logging
 
 import pytest
 import pandas as pd
+import pyodbc
 
 from mssql_dataframe.connect import connect
 from mssql_dataframe.core import create, conversion
@@ -73,6 +74,90 @@ def test_insert_singles(sql):
     )
 
 
+def test_insert_input_unchanged(sql):
+    table_name = "##test_insert_input_unchanged"
+
+    # dtypes already match the SQL table so no conversion is needed
+    columns = {"ColumnA": "DATETIME", "ColumnB": "BINARY(4)"}
+    sql.create.table(table_name, columns)
+    dataframe = pd.DataFrame(
+        {
+            "ColumnA": pd.Series(["1900-01-01 00:00:00.008"], dtype="datetime64[ns]"),
+            "ColumnB": pd.Series([b"a"], dtype="object"),
+        }
+    )
+    original = dataframe.copy()
+
+    # values are rounded and padded in the result but not in the input
+    result = sql.insert.insert(table_name, dataframe)
+    assert result is not dataframe
+    assert dataframe.equals(original)
+    assert result.at[0, "ColumnA"] == pd.Timestamp("1900-01-01 00:00:00.007")
+    assert result.at[0, "ColumnB"] == b"a\x00\x00\x00"
+
+
+def test_insert_null_binary(sql):
+    table_name = "##test_insert_null_binary"
+
+    columns = {"ColumnA": "TINYINT", "ColumnB": "VARBINARY(4)"}
+    sql.create.table(table_name, columns)
+
+    # binary column of only null values has no size to check
+    dataframe = pd.DataFrame({"ColumnA": [1, 2], "ColumnB": [None, None]})
+    dataframe = sql.insert.insert(table_name, dataframe)
+
+    schema, _ = conversion.get_schema(sql.connection, table_name)
+    result = conversion.read_values(
+        f"SELECT * FROM {table_name} ORDER BY ColumnA", schema, sql.connection
+    )
+    assert result["ColumnA"].tolist() == [1, 2]
+    assert result["ColumnB"].isna().all()
+
+
+def test_insert_batches(sql, monkeypatch):
+    table_name = "##test_insert_batches"
+
+    columns = {"ColumnA": "TINYINT", "ColumnB": "VARCHAR(1)"}
+    sql.create.table(table_name, columns, primary_key_column="ColumnA")
+
+    # insert in batches of 3 rows, with the last batch partially filled
+    monkeypatch.setattr(conversion, "insert_size", 3)
+    dataframe = pd.DataFrame(
+        {"ColumnA": range(7), "ColumnB": list("abcdefg")},
+    ).set_index("ColumnA")
+    dataframe = sql.insert.insert(table_name, dataframe)
+
+    schema, _ = conversion.get_schema(sql.connection, table_name)
+    result = conversion.read_values(
+        f"SELECT * FROM {table_name} ORDER BY ColumnA", schema, sql.connection
+    )
+    assert result.index.tolist() == list(range(7))
+    assert result["ColumnB"].tolist() == list("abcdefg")
+
+
+def test_insert_empty(sql):
+    table_name = "##test_insert_empty"
+
+    columns = {"ColumnA": "TINYINT", "ColumnB": "VARCHAR(1)"}
+    sql.create.table(table_name, columns)
+
+    # a dataframe without rows raises an error instead of silently inserting nothing
+    dataframe = pd.DataFrame(
+        {
+            "ColumnA": pd.Series([], dtype="UInt8"),
+            "ColumnB": pd.Series([], dtype="string"),
+        }
+    )
+    with pytest.raises(pyodbc.ProgrammingError):
+        sql.insert.insert(table_name, dataframe)
+
+    schema, _ = conversion.get_schema(sql.connection, table_name)
+    result = conversion.read_values(
+        f"SELECT * FROM {table_name}", schema, sql.connection
+    )
+    assert len(result) == 0
+
+
 def test_insert_composite_pk(sql):
     table_name = "##test_insert_composite_pk"
 
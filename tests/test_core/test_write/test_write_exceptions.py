@@ -1,12 +1,14 @@
 import env
+import logging
 
+import pyodbc
 import pytest
 import pandas as pd
 
 from mssql_dataframe.core import custom_errors
 
 from mssql_dataframe.connect import connect
-from mssql_dataframe.core import create
+from mssql_dataframe.core import create, conversion
 from mssql_dataframe.core.write import insert, update, merge
 
 
@@ -26,6 +28,26 @@ def sql():
     db.connection.close()
 
 
+@pytest.fixture()
+def temp_name(monkeypatch):
+    # predictable name for the source table created by update and merge
+    monkeypatch.setattr(insert.random, "choices", lambda *args, **kwargs: "test")
+    yield "_source_temp_name_upt_test"
+
+
+def constrained_table(sql, table_name):
+    # target table that rejects values the source table allows
+    sql.create.table(
+        table_name,
+        columns={"ColumnA": "TINYINT", "ColumnB": "TINYINT"},
+        primary_key_column="ColumnA",
+    )
+    sql.insert.insert(table_name, pd.DataFrame({"ColumnA": [1, 2], "ColumnB": [1, 2]}))
+    cursor = sql.connection.cursor()
+    cursor.execute(f"ALTER TABLE {table_name} ADD CHECK (ColumnB < 10)")
+    cursor.commit()
+
+
 def test_insert_error_nonexistant(sql):
     table_name = "##test_insert_error_nonexistant"
 
@@ -153,3 +175,59 @@ def test_merge_errors(sql):
             upsert=True,
             delete_requires=["ColumnB"],
         )
+
+
+def test_update_source_errors(sql, temp_name):
+    table_name = "##test_update_source_errors"
+    constrained_table(sql, table_name)
+
+    # source table cannot be loaded with duplicate match column values
+    with pytest.raises(pyodbc.IntegrityError):
+        sql.update.update(
+            table_name,
+            dataframe=pd.DataFrame({"ColumnA": [1, 2], "ColumnB": [5, 5]}),
+            match_columns=["ColumnB"],
+        )
+    with pytest.raises(custom_errors.SQLTableDoesNotExist):
+        conversion.get_schema(sql.connection, temp_name)
+
+    # update statement fails the target table's check constraint
+    with pytest.raises(pyodbc.IntegrityError):
+        sql.update.update(
+            table_name, dataframe=pd.DataFrame({"ColumnA": [1], "ColumnB": [20]})
+        )
+    with pytest.raises(custom_errors.SQLTableDoesNotExist):
+        conversion.get_schema(sql.connection, temp_name)
+
+
+def test_merge_source_errors(sql, temp_name):
+    table_name = "##test_merge_source_errors"
+    constrained_table(sql, table_name)
+
+    # merge statement fails the target table's check constraint
+    with pytest.raises(pyodbc.IntegrityError):
+        sql.merge.merge(
+            table_name,
+            dataframe=pd.DataFrame({"ColumnA": [1, 3], "ColumnB": [20, 3]}),
+            upsert=True,
+        )
+    with pytest.raises(custom_errors.SQLTableDoesNotExist):
+        conversion.get_schema(sql.connection, temp_name)
+
+
+def test_drop_source_errors(sql, caplog):
+    cursor = sql.connection.cursor()
+    temp_name = "_source_temp_name_upt_missing"
+
+    # error is raised if the operation using the source table succeeded
+    with pytest.raises(pyodbc.ProgrammingError):
+        sql.update._drop_source(cursor, temp_name)
+    cursor.rollback()
+
+    # error is only logged if the operation already failed, to keep its exception
+    sql.update._drop_source(cursor, temp_name, failure=True)
+    cursor.rollback()
+    assert len(caplog.record_tuples) == 1
+    assert caplog.record_tuples[0][0] == "mssql_dataframe.core.write.insert"
+    assert caplog.record_tuples[0][1] == logging.WARNING
+    assert temp_name in caplog.record_tuples[0][2]
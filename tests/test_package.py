@@ -68,6 +68,7 @@ def test_SQLServer_log_init(caplog):
             trusted_connection="yes",
         )
         assert isinstance(sql.version_spec, dict)
+        assert isinstance(sql.version_spec["sql"], str)
 
         # assert warnings raised by logging after all other tasks
         assert len(caplog.record_tuples) == 1
@@ -76,6 +77,18 @@ def test_SQLServer_log_init(caplog):
         assert caplog.record_tuples[0][2].startswith("Version Numbers:")
 
 
+def test_SQLServer_version_spec(caplog):
+    # the SQL version isn't queried without debug logging, but the key is always present
+    with caplog.at_level(logging.INFO, logger="mssql_dataframe"):
+        sql = SQLServer(
+            database=env.database,
+            server=env.server,
+            driver=env.driver,
+            trusted_connection="yes",
+        )
+    assert sql.version_spec["sql"] is None
+
+
 def test_SQLServer_schema():
     table_name = "##test_SQLServer_schema"
     sql = SQLServer(
@@ -88,3 +101,10 @@ def test_SQLServer_schema():
 
     schema = sql.get_schema(table_name)
     assert schema.index.equals(pd.Index(["ColumnA"], dtype="string"))
+
+    # schema is read again after a change outside of mssql_dataframe
+    cursor = sql.connection.cursor()
+    cursor.execute(f"ALTER TABLE {table_name} ADD ColumnB INT")
+    sql.invalidate_schema(table_name)
+    schema = sql.get_schema(table_name)
+    assert schema.index.equals(pd.Index(["ColumnA", "ColumnB"], dtype="string"))
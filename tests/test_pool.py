@@ -0,0 +1,104 @@
+import env
+
+import pytest
+import pandas as pd
+import pyodbc
+
+import mssql_dataframe.pool as pool_module
+from mssql_dataframe.connect import connect
+from mssql_dataframe.pool import pool
+from mssql_dataframe.core import create
+from mssql_dataframe.core.write import insert
+from mssql_dataframe.__equality__ import compare_dfs
+
+pd.options.mode.chained_assignment = "raise"
+
+table_names = ["##test_pool_a", "##test_pool_b", "##test_pool_c"]
+
+
+@pytest.fixture(scope="module")
+def sample():
+    # tables are created by a separate connection that stays open during the tests
+    db = connect(
+        database=env.database,
+        server=env.server,
+        driver=env.driver,
+        trusted_connection="yes",
+    )
+    writer = insert.insert(db.connection, include_metadata_timestamps=False)
+    result = {}
+    for idx, table_name in enumerate(table_names):
+        create.create(db.connection).table(
+            table_name, columns={"ColumnA": "INT", "ColumnB": "VARCHAR(1)"}
+        )
+        dataframe = pd.DataFrame(
+            {"ColumnA": [idx, idx + 1], "ColumnB": ["a", "b"]}
+        ).astype({"ColumnA": "Int32", "ColumnB": "string"})
+        result[table_name] = writer.insert(table_name, dataframe)
+    yield result
+    db.connection.close()
+
+
+@pytest.fixture(scope="module")
+def connections():
+    connections = pool(
+        size=2,
+        database=env.database,
+        server=env.server,
+        driver=env.driver,
+        trusted_connection="yes",
+    )
+    yield connections
+    connections.close()
+
+
+def test_read_many(connections, sample):
+    # more queries than connections, results in the same order as queries
+    result = connections.read_many(table_names)
+    assert len(result) == len(table_names)
+    for table_name, dataframe in zip(table_names, result):
+        assert compare_dfs(dataframe, sample[table_name])
+
+    # keyword arguments for read.table
+    result = connections.read_many(
+        [{"table_name": table_names[0], "column_names": "ColumnA", "limit": 1}]
+    )
+    assert result[0].columns.tolist() == ["ColumnA"]
+    assert len(result[0]) == 1
+
+    # all connections are returned to the pool
+    assert connections.connections.qsize() == connections.size
+
+
+def test_exceptions(connections, sample):
+    with pytest.raises(ValueError):
+        pool(size=0)
+
+    # exception from a query is raised and the connection is still returned
+    with pytest.raises(ValueError):
+        connections.read_many([{"table_name": table_names[0], "limit": "1"}])
+    assert connections.connections.qsize() == connections.size
+
+
+def test_connect_failure(monkeypatch):
+    # connections already established are closed if a later connection fails
+    opened = []
+
+    def failing_connect(**kwargs):
+        if opened:
+            raise pyodbc.Error("unable to connect")
+        db = connect(**kwargs)
+        opened.append(db.connection)
+        return db
+
+    monkeypatch.setattr(pool_module, "connect", failing_connect)
+    with pytest.raises(pyodbc.Error):
+        pool(
+            size=2,
+            database=env.database,
+            server=env.server,
+            driver=env.driver,
+            trusted_connection="yes",
+        )
+    assert len(opened) == 1
+    assert opened[0].closed
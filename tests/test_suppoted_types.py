@@ -8,7 +8,7 @@ from numpy import inf
 import pytest
 
 from mssql_dataframe.connect import connect
-from mssql_dataframe.core import create
+from mssql_dataframe.core import create, conversion
 from mssql_dataframe.core import conversion_rules
 from mssql_dataframe.core.write import insert, update, merge
 from mssql_dataframe.core.read import read
@@ -224,6 +224,31 @@ def test_merge(sql, sample, caplog):
     compare_dfs(df, result)
 
 
+def test_read_chunks(sql, sample, caplog, monkeypatch):
+    table_name = "##test_supported_dtypes_read_chunks"
+
+    # create table with primary key to also compare the index
+    columns = sample["columns"]
+    columns["pk"] = "TINYINT"
+    sql.create.table(table_name, columns, primary_key_column="pk")
+    base = sample["dataframe"].copy()
+    base.index.name = "pk"
+    _ = sql.insert.insert(table_name, base)
+    caplog = check_expected_warnings(caplog)
+
+    # read in a single fetch
+    single = sql.read.table(table_name, order_column="pk", order_direction="ASC")
+
+    # read one row per fetch, so the row of all null values is a separate chunk
+    monkeypatch.setattr(conversion, "fetch_size", 1)
+    chunked = sql.read.table(table_name, order_column="pk", order_direction="ASC")
+
+    assert chunked.dtypes.equals(single.dtypes)
+    assert chunked.index.equals(single.index)
+    assert chunked.index.dtype == single.index.dtype
+    compare_dfs(chunked, single)
+
+
 def test_dtypes_index(sql, sample, caplog):
     for pk in sample["columns"].keys():
         table_name = f"##test_supported_dtypes_index_{pk}"